@@ -1,18 +1,80 @@
 
 import os
+import sys
+import time
+import shutil
 import logging
-from datetime import datetime, timedelta
+import logging.handlers
+import functools
+from dataclasses import dataclass
+from types import MappingProxyType
+
+# Accepted spellings of a true boolean environment variable
+_TRUTHY = frozenset({'true', '1', 'yes', 'y', 'on', 't'})
+
+def _parse_bool(value):
+    """Parse a boolean environment value"""
+    return value.strip().lower() in _TRUTHY
+
+# Snapshot of the environment, read once at import
+_ENV = os.environ.copy()
+
+# Typed environment settings as name: (parser, default); every value is
+# coerced in the single pass that builds _PARSED
+_SCHEMA = {
+    'DEBUG': (_parse_bool, 'true'),
+    'MAX_ARTICLES_PER_RUN': (int, '500'),
+    'MAX_ARTICLES_PER_CATEGORY': (int, '50'),
+    'MAX_ARTICLES_PER_TOPIC': (int, '30'),
+    'SENTIMENT_BATCH_SIZE': (int, '100'),
+    'API_RATE_LIMIT': (float, '1.0'),
+    'MAX_RETRIES': (int, '3'),
+    'RETRY_DELAY': (float, '2.0'),
+    'MAX_RETRY_AFTER': (float, '60'),
+    'MIN_TITLE_LENGTH': (int, '10'),
+    'MAX_TITLE_LENGTH': (int, '200'),
+    'MIN_DESCRIPTION_LENGTH': (int, '20'),
+    'MAX_DESCRIPTION_LENGTH': (int, '500'),
+    'DUPLICATE_THRESHOLD': (float, '0.8'),
+    'POSITIVE_THRESHOLD': (float, '0.1'),
+    'NEGATIVE_THRESHOLD': (float, '-0.1'),
+    'CONFIDENCE_THRESHOLD': (float, '0.5'),
+    'SENTIMENT_ANALYZER': (str.lower, 'textblob'),
+    'MAX_KEYWORDS': (int, '10'),
+    'REALTIME_ENABLED': (_parse_bool, 'false'),
+    'REALTIME_INTERVAL': (int, '15'),
+    'MAX_CONCURRENT_REQUESTS': (int, '5'),
+    'BATCH_PROCESSING': (_parse_bool, 'true'),
+    'DASHBOARD_PORT': (int, '8501'),
+    'AUTO_REFRESH': (_parse_bool, 'true'),
+    'REFRESH_INTERVAL': (int, '300'),
+    'MAX_ARTICLES_DISPLAY': (int, '100'),
+    'MONITORING_ENABLED': (_parse_bool, 'true'),
+    'HEALTH_CACHE_TTL': (float, '5'),
+    'ERROR_RATE_THRESHOLD': (float, '0.05'),
+    'PROCESSING_TIME_THRESHOLD': (float, '300'),
+    'MEMORY_USAGE_THRESHOLD': (float, '0.8'),
+    'MAX_WORKERS': (int, '4'),
+    'CHUNK_SIZE': (int, '50'),
+    'REQUEST_TIMEOUT': (int, '30'),
+    'CONNECTION_POOL_SIZE': (int, '10'),
+}
+_PARSED = {name: parse(_ENV.get(name, default)) for name, (parse, default) in _SCHEMA.items()}
 
 # Environment detection
-ENVIRONMENT = os.getenv('ENVIRONMENT', 'development')
-DEBUG = os.getenv('DEBUG', 'true').lower() == 'true'
+ENVIRONMENT = _ENV.get('ENVIRONMENT', 'development')
+DEBUG = _PARSED['DEBUG']
 
 # API Configuration
-API_KEY = os.getenv('GNEWS_API_KEY', "your_api")
+API_KEY = _ENV.get('GNEWS_API_KEY', "your_api")
 BASE_URL = "https://gnews.io/api/v4"
 
+# Masked key for banners and logs; short keys are never echoed
+_API_KEY_DISPLAY = (API_KEY[:4] + '...' + API_KEY[-2:]) if len(API_KEY) >= 10 else '***'
+
 # Database Configuration - Cloud Support
-DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///news.db')
+_DB_URL = _ENV.get('DATABASE_URL', 'sqlite:///news.db')
+DATABASE_URL = _DB_URL
 DATABASE_CONFIG = {
     'development': {
         'type': 'sqlite',
@@ -21,7 +83,7 @@ DATABASE_CONFIG = {
     },
     'production': {
         'type': 'postgresql',
-        'url': os.getenv('DATABASE_URL', 'sqlite:///news.db'),
+        'url': _DB_URL,
         'pool_size': 20,
         'max_overflow': 30
     }
@@ -29,45 +91,85 @@ DATABASE_CONFIG = {
 
 # Cloud Storage Configuration
 CLOUD_STORAGE = {
-    'provider': os.getenv('CLOUD_PROVIDER', 'local'),  # 'aws', 'azure', 'local'
+    'provider': _ENV.get('CLOUD_PROVIDER', 'local'),  # 'aws', 'azure', 'local'
     'aws': {
-        'bucket': os.getenv('AWS_S3_BUCKET', 'news-intelligence-data'),
-        'region': os.getenv('AWS_REGION', 'us-east-1'),
-        'access_key': os.getenv('AWS_ACCESS_KEY_ID'),
-        'secret_key': os.getenv('AWS_SECRET_ACCESS_KEY')
+        'bucket': _ENV.get('AWS_S3_BUCKET', 'news-intelligence-data'),
+        'region': _ENV.get('AWS_REGION', 'us-east-1'),
+        'access_key': _ENV.get('AWS_ACCESS_KEY_ID'),
+        'secret_key': _ENV.get('AWS_SECRET_ACCESS_KEY')
     },
     'azure': {
-        'storage_account': os.getenv('AZURE_STORAGE_ACCOUNT'),
-        'container': os.getenv('AZURE_CONTAINER', 'news-data'),
-        'connection_string': os.getenv('AZURE_STORAGE_CONNECTION_STRING')
+        'storage_account': _ENV.get('AZURE_STORAGE_ACCOUNT'),
+        'container': _ENV.get('AZURE_CONTAINER', 'news-data'),
+        'connection_string': _ENV.get('AZURE_STORAGE_CONNECTION_STRING')
     }
 }
 
 # Logging Configuration
-LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+LOG_LEVEL = _ENV.get('LOG_LEVEL', 'INFO')
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-LOG_FILE = os.getenv('LOG_FILE', 'news_pipeline.log')
-
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL),
-    format=LOG_FORMAT,
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler()
-    ]
-)
+LOG_FILE = _ENV.get('LOG_FILE', 'news_pipeline.log')
+
+_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL
+}
+# Unknown level names fall back to INFO and are reported by validate_config()
+LOG_LEVEL_VALUE = _LEVELS.get(LOG_LEVEL.upper(), logging.INFO)
+
+# The log format never shows thread or process details, so skip collecting them
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Log records reaching the file are batched; ERROR and above flush immediately
+LOG_BUFFER_CAPACITY = 1024
+
+_logging_initialized = False
+
+def init_logging():
+    """Install the pipeline's log handlers once per process
+    
+    Called from entry points rather than at import, so importing config
+    (e.g. in worker processes) does not open the log file.
+    """
+    global _logging_initialized
+    if _logging_initialized:
+        return
+    _logging_initialized = True
+    
+    # One pre-built formatter shared by every handler
+    formatter = logging.Formatter(LOG_FORMAT, style='%', validate=False)
+    file_handler = logging.FileHandler(LOG_FILE)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    
+    logging.basicConfig(
+        level=LOG_LEVEL_VALUE,
+        handlers=[
+            logging.handlers.MemoryHandler(
+                capacity=LOG_BUFFER_CAPACITY,
+                flushLevel=logging.ERROR,
+                target=file_handler
+            ),
+            stream_handler
+        ]
+    )
 
 # Create logger
 logger = logging.getLogger(__name__)
 
 # News Configuration
-CATEGORIES = [
+CATEGORIES = (
     'general', 'world', 'business', 'technology', 
     'entertainment', 'sports', 'science', 'health'
-]
+)
 
-SEARCH_TOPICS = [
+SEARCH_TOPICS = (
     "artificial intelligence",
     "climate change", 
     "technology news",
@@ -75,91 +177,164 @@ SEARCH_TOPICS = [
     "health news",
     "cryptocurrency",
     "space exploration"
-]
+)
+
+@dataclass(frozen=True, slots=True)
+class ProcessingConfig:
+    max_articles_per_run: int
+    max_articles_per_category: int
+    max_articles_per_topic: int
+    sentiment_batch_size: int
+    api_rate_limit: float  # seconds between calls
+    max_retries: int
+    retry_delay: float
+    max_retry_after: float  # longest server Retry-After honoured, seconds
+
+@dataclass(frozen=True, slots=True)
+class DataQualityConfig:
+    min_title_length: int
+    max_title_length: int
+    min_description_length: int
+    max_description_length: int
+    required_fields: tuple
+    duplicate_threshold: float
+
+@dataclass(frozen=True, slots=True)
+class SentimentConfig:
+    positive_threshold: float
+    negative_threshold: float
+    confidence_threshold: float
+    max_keywords: int
+    analyzer: str
+
+@dataclass(frozen=True, slots=True)
+class RealtimeConfig:
+    enabled: bool
+    interval_minutes: int
+    max_concurrent_requests: int
+    batch_processing: bool
+
+@dataclass(frozen=True, slots=True)
+class DashboardConfig:
+    title: str
+    host: str
+    port: int
+    auto_refresh: bool
+    refresh_interval: int  # seconds
+    max_articles_display: int
+
+@dataclass(frozen=True, slots=True)
+class AlertThresholds:
+    error_rate: float
+    processing_time: float
+    memory_usage: float
+
+@dataclass(frozen=True, slots=True)
+class MonitoringConfig:
+    enabled: bool
+    metrics_endpoint: str
+    health_check_endpoint: str
+    cache_ttl: float  # seconds a health check result is reused
+    alert_thresholds: AlertThresholds
 
 # Processing Configuration
-PROCESSING_CONFIG = {
-    'max_articles_per_run': int(os.getenv('MAX_ARTICLES_PER_RUN', '500')),
-    'max_articles_per_category': int(os.getenv('MAX_ARTICLES_PER_CATEGORY', '50')),
-    'max_articles_per_topic': int(os.getenv('MAX_ARTICLES_PER_TOPIC', '30')),
-    'sentiment_batch_size': int(os.getenv('SENTIMENT_BATCH_SIZE', '100')),
-    'api_rate_limit': float(os.getenv('API_RATE_LIMIT', '1.0')),  # seconds between calls
-    'max_retries': int(os.getenv('MAX_RETRIES', '3')),
-    'retry_delay': float(os.getenv('RETRY_DELAY', '2.0'))
-}
+PROCESSING_CONFIG = ProcessingConfig(
+    max_articles_per_run=_PARSED['MAX_ARTICLES_PER_RUN'],
+    max_articles_per_category=_PARSED['MAX_ARTICLES_PER_CATEGORY'],
+    max_articles_per_topic=_PARSED['MAX_ARTICLES_PER_TOPIC'],
+    sentiment_batch_size=_PARSED['SENTIMENT_BATCH_SIZE'],
+    api_rate_limit=_PARSED['API_RATE_LIMIT'],
+    max_retries=_PARSED['MAX_RETRIES'],
+    retry_delay=_PARSED['RETRY_DELAY'],
+    max_retry_after=_PARSED['MAX_RETRY_AFTER']
+)
 
 # Data Quality Configuration
-DATA_QUALITY = {
-    'min_title_length': int(os.getenv('MIN_TITLE_LENGTH', '10')),
-    'max_title_length': int(os.getenv('MAX_TITLE_LENGTH', '200')),
-    'min_description_length': int(os.getenv('MIN_DESCRIPTION_LENGTH', '20')),
-    'max_description_length': int(os.getenv('MAX_DESCRIPTION_LENGTH', '500')),
-    'required_fields': ['title', 'url', 'source'],
-    'duplicate_threshold': float(os.getenv('DUPLICATE_THRESHOLD', '0.8'))
-}
+DATA_QUALITY = DataQualityConfig(
+    min_title_length=_PARSED['MIN_TITLE_LENGTH'],
+    max_title_length=_PARSED['MAX_TITLE_LENGTH'],
+    min_description_length=_PARSED['MIN_DESCRIPTION_LENGTH'],
+    max_description_length=_PARSED['MAX_DESCRIPTION_LENGTH'],
+    required_fields=('title', 'url', 'source'),
+    duplicate_threshold=_PARSED['DUPLICATE_THRESHOLD']
+)
+
+# O(1) membership checks for record validators
+REQUIRED_FIELDS_SET = frozenset(DATA_QUALITY.required_fields)
+
+# Accepted SENTIMENT_ANALYZER values
+SENTIMENT_ANALYZERS = frozenset({'textblob', 'vader', 'lexicon'})
 
 # Sentiment Analysis Configuration
-SENTIMENT_CONFIG = {
-    'positive_threshold': float(os.getenv('POSITIVE_THRESHOLD', '0.1')),
-    'negative_threshold': float(os.getenv('NEGATIVE_THRESHOLD', '-0.1')),
-    'confidence_threshold': float(os.getenv('CONFIDENCE_THRESHOLD', '0.5')),
-    'max_keywords': int(os.getenv('MAX_KEYWORDS', '10'))
-}
+SENTIMENT_CONFIG = SentimentConfig(
+    positive_threshold=_PARSED['POSITIVE_THRESHOLD'],
+    negative_threshold=_PARSED['NEGATIVE_THRESHOLD'],
+    confidence_threshold=_PARSED['CONFIDENCE_THRESHOLD'],
+    max_keywords=_PARSED['MAX_KEYWORDS'],
+    analyzer=_PARSED['SENTIMENT_ANALYZER']
+)
 
 # Real-time Processing Configuration
-REALTIME_CONFIG = {
-    'enabled': os.getenv('REALTIME_ENABLED', 'false').lower() == 'true',
-    'interval_minutes': int(os.getenv('REALTIME_INTERVAL', '15')),
-    'max_concurrent_requests': int(os.getenv('MAX_CONCURRENT_REQUESTS', '5')),
-    'batch_processing': os.getenv('BATCH_PROCESSING', 'true').lower() == 'true'
-}
+REALTIME_CONFIG = RealtimeConfig(
+    enabled=_PARSED['REALTIME_ENABLED'],
+    interval_minutes=_PARSED['REALTIME_INTERVAL'],
+    max_concurrent_requests=_PARSED['MAX_CONCURRENT_REQUESTS'],
+    batch_processing=_PARSED['BATCH_PROCESSING']
+)
 
 # Dashboard Configuration
-DASHBOARD_CONFIG = {
-    'title': os.getenv('DASHBOARD_TITLE', 'News Intelligence Pipeline'),
-    'host': os.getenv('DASHBOARD_HOST', 'localhost'),
-    'port': int(os.getenv('DASHBOARD_PORT', '8501')),
-    'auto_refresh': os.getenv('AUTO_REFRESH', 'true').lower() == 'true',
-    'refresh_interval': int(os.getenv('REFRESH_INTERVAL', '300')),  # seconds
-    'max_articles_display': int(os.getenv('MAX_ARTICLES_DISPLAY', '100'))
-}
+DASHBOARD_CONFIG = DashboardConfig(
+    title=_ENV.get('DASHBOARD_TITLE', 'News Intelligence Pipeline'),
+    host=_ENV.get('DASHBOARD_HOST', 'localhost'),
+    port=_PARSED['DASHBOARD_PORT'],
+    auto_refresh=_PARSED['AUTO_REFRESH'],
+    refresh_interval=_PARSED['REFRESH_INTERVAL'],
+    max_articles_display=_PARSED['MAX_ARTICLES_DISPLAY']
+)
 
 # Monitoring Configuration
-MONITORING = {
-    'enabled': os.getenv('MONITORING_ENABLED', 'true').lower() == 'true',
-    'metrics_endpoint': os.getenv('METRICS_ENDPOINT', '/metrics'),
-    'health_check_endpoint': os.getenv('HEALTH_CHECK_ENDPOINT', '/health'),
-    'alert_thresholds': {
-        'error_rate': float(os.getenv('ERROR_RATE_THRESHOLD', '0.05')),
-        'processing_time': float(os.getenv('PROCESSING_TIME_THRESHOLD', '300')),
-        'memory_usage': float(os.getenv('MEMORY_USAGE_THRESHOLD', '0.8'))
-    }
-}
+MONITORING = MonitoringConfig(
+    enabled=_PARSED['MONITORING_ENABLED'],
+    metrics_endpoint=_ENV.get('METRICS_ENDPOINT', '/metrics'),
+    health_check_endpoint=_ENV.get('HEALTH_CHECK_ENDPOINT', '/health'),
+    cache_ttl=_PARSED['HEALTH_CACHE_TTL'],
+    alert_thresholds=AlertThresholds(
+        error_rate=_PARSED['ERROR_RATE_THRESHOLD'],
+        processing_time=_PARSED['PROCESSING_TIME_THRESHOLD'],
+        memory_usage=_PARSED['MEMORY_USAGE_THRESHOLD']
+    )
+)
+
+# Last formatted values as [epoch bucket, string]; timestamps only change
+# once per second and the API cutoff once per minute
+_ts_cache = [None, ""]
+_yesterday_cache = [None, ""]
 
 def get_timestamp():
     """Get current timestamp in standard format"""
-    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    t = int(time.time())
+    if t != _ts_cache[0]:
+        _ts_cache[:] = [t, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(t))]
+    return _ts_cache[1]
 
 def get_yesterday():
     """Get yesterday's date for API calls"""
-    yesterday = datetime.now() - timedelta(days=1)
-    return yesterday.strftime('%Y-%m-%dT%H:%M:%SZ')
+    t = int(time.time()) // 60 * 60
+    if t != _yesterday_cache[0]:
+        _yesterday_cache[:] = [t, time.strftime('%Y-%m-%dT%H:%M:%SZ', time.localtime(t - 86400))]
+    return _yesterday_cache[1]
 
+@functools.lru_cache(maxsize=None)
 def get_database_config():
     """Get database configuration based on environment"""
-    return DATABASE_CONFIG.get(ENVIRONMENT, DATABASE_CONFIG['development'])
+    return _CONFIG_SNAPSHOT['database']
 
+@functools.lru_cache(maxsize=None)
 def get_cloud_storage_config():
     """Get cloud storage configuration"""
-    provider = CLOUD_STORAGE['provider']
-    if provider == 'aws':
-        return CLOUD_STORAGE['aws']
-    elif provider == 'azure':
-        return CLOUD_STORAGE['azure']
-    else:
-        return {'provider': 'local'}
+    return _CONFIG_SNAPSHOT['cloud_storage']
 
-def validate_config():
+def _validate():
     """Validate configuration settings"""
     errors = []
     
@@ -167,7 +342,7 @@ def validate_config():
     if ENVIRONMENT == 'production':
         required_vars = ['GNEWS_API_KEY']
         for var in required_vars:
-            if not os.getenv(var):
+            if not _ENV.get(var):
                 errors.append(f"Missing required environment variable: {var}")
     
     # Validate API key
@@ -175,23 +350,80 @@ def validate_config():
         errors.append("Invalid or missing API key")
     
     # Validate thresholds
-    if SENTIMENT_CONFIG['positive_threshold'] <= SENTIMENT_CONFIG['negative_threshold']:
+    if SENTIMENT_CONFIG.positive_threshold <= SENTIMENT_CONFIG.negative_threshold:
         errors.append("Positive threshold must be greater than negative threshold")
     
-    return errors
+    # Validate sentiment analyzer
+    if SENTIMENT_CONFIG.analyzer not in SENTIMENT_ANALYZERS:
+        errors.append(f"Invalid SENTIMENT_ANALYZER: {SENTIMENT_CONFIG.analyzer}")
+    
+    # Validate log level
+    if LOG_LEVEL.upper() not in _LEVELS:
+        errors.append(f"Invalid LOG_LEVEL: {LOG_LEVEL}")
+    
+    return tuple(errors)
 
+# Settings are fixed after import, so validation only has to run once
+_VALIDATION_ERRORS = _validate()
+
+def validate_config():
+    """Return the configuration errors found at import"""
+    return _VALIDATION_ERRORS
+
+@functools.lru_cache(maxsize=None)
 def get_performance_config():
     """Get performance-related configuration"""
-    return {
-        'max_workers': int(os.getenv('MAX_WORKERS', '4')),
-        'chunk_size': int(os.getenv('CHUNK_SIZE', '50')),
-        'timeout': int(os.getenv('REQUEST_TIMEOUT', '30')),
-        'connection_pool_size': int(os.getenv('CONNECTION_POOL_SIZE', '10'))
-    }
+    return _CONFIG_SNAPSHOT['performance']
+
+# The provider is fixed at startup, so its settings are picked once
+_CLOUD_PROVIDERS = {'aws': CLOUD_STORAGE['aws'], 'azure': CLOUD_STORAGE['azure']}
+_RESOLVED_CLOUD_CFG = _CLOUD_PROVIDERS.get(CLOUD_STORAGE['provider'], {'provider': 'local'})
+
+# Environment-derived settings parsed once at import; the accessors above
+# serve read-only views without touching os.environ again
+_CONFIG_SNAPSHOT = MappingProxyType({
+    'database': MappingProxyType(DATABASE_CONFIG.get(ENVIRONMENT, DATABASE_CONFIG['development'])),
+    'cloud_storage': MappingProxyType(_RESOLVED_CLOUD_CFG),
+    'performance': MappingProxyType({
+        'max_workers': _PARSED['MAX_WORKERS'],
+        'chunk_size': _PARSED['CHUNK_SIZE'],
+        'timeout': _PARSED['REQUEST_TIMEOUT'],
+        'connection_pool_size': _PARSED['CONNECTION_POOL_SIZE']
+    })
+})
+
+# Seconds a disk usage reading is reused before statvfs runs again
+DISK_USAGE_TTL = 30
+
+@functools.lru_cache(maxsize=1)
+def _disk_usage_for_bucket(bucket):
+    return shutil.disk_usage('/')
+
+def _cached_disk_usage():
+    """Disk usage of '/', refreshed at most once per DISK_USAGE_TTL window"""
+    return _disk_usage_for_bucket(int(time.monotonic() // DISK_USAGE_TTL))
+
+# Last health check as (monotonic time, result)
+_last_health = (None, None)
 
 # Application Health Check
 def health_check():
-    """Basic health check for the application"""
+    """Basic health check for the application
+    
+    Results are reused for MONITORING.cache_ttl seconds so frequent scrapes
+    do not rerun every check.
+    """
+    global _last_health
+    checked_at, result = _last_health
+    now = time.monotonic()
+    if checked_at is not None and now - checked_at < MONITORING.cache_ttl:
+        return dict(result)
+    
+    result = _run_health_check()
+    _last_health = (now, result)
+    return dict(result)
+
+def _run_health_check():
     try:
         # Check database connectivity
         db_status = "healthy"
@@ -200,8 +432,7 @@ def health_check():
         api_status = "healthy" if API_KEY else "unhealthy"
         
         # Check disk space (basic check)
-        import shutil
-        disk_usage = shutil.disk_usage('/')
+        disk_usage = _cached_disk_usage()
         disk_free_gb = disk_usage.free / (1024**3)
         disk_status = "healthy" if disk_free_gb > 1 else "warning"
         
@@ -223,27 +454,42 @@ def health_check():
             'error': str(e)
         }
 
-if __name__ == "__main__":
-    print("=== NEWS INTELLIGENCE PIPELINE CONFIGURATION ===")
-    print(f"Environment: {ENVIRONMENT}")
-    print(f"Debug Mode: {DEBUG}")
-    print(f"API Key: {API_KEY[:10]}...")
-    print(f"Database: {get_database_config()['type']}")
-    print(f"Log Level: {LOG_LEVEL}")
-    print(f"Cloud Provider: {CLOUD_STORAGE['provider']}")
-    print(f"Real-time Processing: {REALTIME_CONFIG['enabled']}")
+if __name__ == "__main__" and _ENV.get('CONFIG_SELFTEST', '1') != '0':
+    # --quiet skips the health check (and its disk probe); --once exits with
+    # the validation result, for container healthchecks
+    quiet = '--quiet' in sys.argv
+    once = '--once' in sys.argv
+    
+    init_logging()
+    lines = [
+        "=== NEWS INTELLIGENCE PIPELINE CONFIGURATION ===",
+        f"Environment: {ENVIRONMENT}",
+        f"Debug Mode: {DEBUG}",
+        f"API Key: {_API_KEY_DISPLAY}",
+        f"Database: {get_database_config()['type']}",
+        f"Log Level: {LOG_LEVEL}",
+        f"Cloud Provider: {CLOUD_STORAGE['provider']}",
+        f"Real-time Processing: {REALTIME_CONFIG.enabled}",
+    ]
     
     # Validate configuration
     config_errors = validate_config()
     if config_errors:
-        print(f"\n❌ Configuration Errors:")
-        for error in config_errors:
-            print(f"  - {error}")
+        lines.append("\n❌ Configuration Errors:")
+        lines.extend(f"  - {error}" for error in config_errors)
     else:
-        print("\n✅ Configuration valid!")
+        lines.append("\n✅ Configuration valid!")
     
     # Show health check
-    health = health_check()
-    print(f"\n🏥 Health Status: {health['status']}")
+    if not quiet:
+        health = health_check()
+        lines.append(f"\n🏥 Health Status: {health['status']}")
+    
+    # Emit the whole banner with one write
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
     
     logger.info("Configuration loaded successfully")
+    
+    if once:
+        sys.exit(1 if config_errors else 0)
@@ -5,12 +5,14 @@ Professional-grade interface with comprehensive metrics and alerting
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import time
 import json
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
 import logging
@@ -23,7 +25,7 @@ import config
 
 # Configure page
 st.set_page_config(
-    page_title=config.DASHBOARD_CONFIG['title'],
+    page_title=config.DASHBOARD_CONFIG.title,
     page_icon="📰",
     layout="wide",
     initial_sidebar_state="expanded"
@@ -94,25 +96,162 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Initialize components with caching
-@st.cache_resource
-def init_components():
-    """Initialize all pipeline components"""
+def _init_component(name, factory):
+    """Construct one pipeline component, or None if it fails"""
     try:
-        db = NewsDB()
-        fetcher = NewsFetcher()
-        processor = NewsProcessor()
-        logger.info("All components initialized successfully")
-        return db, fetcher, processor
+        component = factory()
+        logger.info(f"{name} initialized successfully")
+        return component
     except Exception as e:
-        logger.error(f"Failed to initialize components: {e}")
-        st.error(f"Failed to initialize components: {e}")
-        return None, None, None
+        logger.error(f"Failed to initialize {name}: {e}")
+        st.error(f"Failed to initialize {name}: {e}")
+        return None
+
+# Each component is cached on its own and built on first use, so a rerun
+# only constructs the ones its code path actually calls
+@st.cache_resource
+def get_db():
+    """Shared NewsDB"""
+    return _init_component("Database", NewsDB)
+
+@st.cache_resource
+def get_fetcher():
+    """Shared NewsFetcher"""
+    return _init_component("Fetcher", NewsFetcher)
+
+@st.cache_resource
+def get_processor():
+    """Shared NewsProcessor"""
+    return _init_component("Processor", NewsProcessor)
+
+# Low-cardinality label columns, stored as pandas categoricals so repeated
+# groupby/value_counts work on integer codes instead of rehashing strings
+CATEGORICAL_COLUMNS = ('source', 'sentiment_label', 'category')
+
+def _prepare_articles(df):
+    """Convert label columns to category dtype and parse created_at once"""
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    if 'created_at' in df.columns:
+        df['created_at'] = pd.to_datetime(df['created_at'], format='ISO8601', cache=True)
+        df['created_date'] = df['created_at'].dt.normalize()
+    return df
+
+def _parse_days(df):
+    """Parse the 'day' column of a daily aggregate once, before caching"""
+    df['day'] = pd.to_datetime(df['day'], format='%Y-%m-%d')
+    return df
+
+# Cached query wrappers: widget interactions rerun the whole script, so
+# identical queries within the TTL are served without touching SQLite
+@st.cache_data(ttl=60, show_spinner=False)
+def load_articles(limit, min_quality, since=None):
+    """Cached db.get_articles"""
+    return _prepare_articles(get_db().get_articles(limit=limit, min_quality=min_quality, since=since))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def search_articles(search_term, limit):
+    """Cached db.search_articles"""
+    return _prepare_articles(get_db().search_articles(search_term, limit=limit))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_daily_quality(min_quality, days=30):
+    """Cached db.get_daily_quality"""
+    return _parse_days(get_db().get_daily_quality(min_quality=min_quality, days=days))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_daily_sentiment_counts(min_quality, days=30):
+    """Cached db.get_daily_sentiment_counts"""
+    return _parse_days(get_db().get_daily_sentiment_counts(min_quality=min_quality, days=days))
+
+@st.cache_data(ttl=120, show_spinner=False)
+def load_trending_topics(articles_df):
+    """Cached processor.detect_trending_topics, keyed on the frame's content hash"""
+    return get_processor().detect_trending_topics(articles_df)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_performance_metrics():
+    """Cached db.get_performance_metrics"""
+    return get_db().get_performance_metrics()
+
+# Sidebar time ranges; None means no lower bound on created_at
+TIME_RANGES = {
+    "Last 24 hours": timedelta(days=1),
+    "Last 3 days": timedelta(days=3),
+    "Last 7 days": timedelta(days=7),
+    "Last 30 days": timedelta(days=30),
+    "All time": None
+}
+
+def time_range_start(time_range):
+    """Lower created_at bound for a sidebar time range, or None
+    
+    Truncated to the minute so reruns within the same minute reuse the
+    cached query. created_at is stored in local time, so the bound is too.
+    """
+    delta = TIME_RANGES.get(time_range)
+    if delta is None:
+        return None
+    start = datetime.now().replace(second=0, microsecond=0) - delta
+    return start.strftime('%Y-%m-%d %H:%M:%S')
+
+# Chart colors shared by the pie and trend figures
+SENTIMENT_COLORS = {
+    'positive': '#28a745',
+    'negative': '#dc3545',
+    'neutral': '#6c757d'
+}
 
-# Global components
-db, fetcher, processor = init_components()
+QUALITY_BIN_EDGES = np.array([0, 0.5, 0.7, 0.9, 1.0])
+QUALITY_LABELS = ['Poor', 'Fair', 'Good', 'Excellent']
+
+QUALITY_COLORS = {
+    'Excellent': '#28a745',
+    'Good': '#17a2b8',
+    'Fair': '#ffc107',
+    'Poor': '#dc3545'
+}
+
+# Plotly client options: no mode-bar logo, no wheel zoom, and no
+# window-resize relayout (Streamlit already sizes the chart container)
+PLOTLY_CONFIG = {
+    'displaylogo': False,
+    'scrollZoom': False,
+    'responsive': False
+}
+
+def show_chart(fig):
+    """Render a figure at container width with the shared Plotly options
+    
+    A constant uirevision keeps zoom/legend state across reruns, so the
+    browser does not reset the layout each time the data is redrawn.
+    """
+    fig.update_layout(uirevision='static')
+    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
 
 # Health check functions
+# (component, alert prefix, overall status when the component is not healthy)
+HEALTH_PROBES = (
+    ('database', 'Database issue', 'warning'),
+    ('ingestion', 'API issue', 'unhealthy'),
+    ('processor', 'Processor issue', 'warning'),
+    ('application', 'Application issue', 'unhealthy')
+)
+
+def _health_probes():
+    """Map each available component to its health check callable"""
+    db, fetcher, processor = get_db(), get_fetcher(), get_processor()
+    probes = {'application': config.health_check}
+    if db:
+        probes['database'] = db.get_database_health
+    if fetcher:
+        probes['ingestion'] = fetcher.get_health_status
+    if processor:
+        probes['processor'] = processor.get_health_status
+    return probes
+
+@st.cache_data(ttl=15, show_spinner=False)
 def get_system_health():
     """Get comprehensive system health status"""
     try:
@@ -123,36 +262,28 @@ def get_system_health():
             'metrics': {}
         }
         
-        # Check database health
-        if db:
-            db_health = db.get_database_health()
-            health_status['components']['database'] = db_health
-            if db_health['status'] != 'healthy':
-                health_status['overall'] = 'warning'
-                health_status['alerts'].append(f"Database issue: {db_health.get('error', 'Unknown error')}")
-        
-        # Check ingestion health
-        if fetcher:
-            ingestion_health = fetcher.get_health_status()
-            health_status['components']['ingestion'] = ingestion_health
-            if ingestion_health['status'] != 'healthy':
-                health_status['overall'] = 'unhealthy'
-                health_status['alerts'].append(f"API issue: {ingestion_health.get('error', 'Unknown error')}")
-        
-        # Check processor health
-        if processor:
-            processor_health = processor.get_health_status()
-            health_status['components']['processor'] = processor_health
-            if processor_health['status'] != 'healthy':
-                health_status['overall'] = 'warning'
-                health_status['alerts'].append(f"Processor issue: {processor_health.get('error', 'Unknown error')}")
-        
-        # Check application health
-        app_health = config.health_check()
-        health_status['components']['application'] = app_health
-        if app_health['status'] != 'healthy':
-            health_status['overall'] = 'unhealthy'
-            health_status['alerts'].append(f"Application issue: {app_health.get('error', 'Unknown error')}")
+        # The probes are I/O bound (DB ping, API request), so run them
+        # concurrently and let one failing probe not block the others
+        probes = _health_probes()
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            futures = {executor.submit(probe): name for name, probe in probes.items()}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logger.error(f"{name} health check failed: {e}")
+                    results[name] = {'status': 'unhealthy', 'error': str(e)}
+        
+        for name, alert_prefix, failed_status in HEALTH_PROBES:
+            if name not in results:
+                continue
+            component_health = results[name]
+            health_status['components'][name] = component_health
+            if component_health['status'] != 'healthy':
+                health_status['overall'] = failed_status
+                health_status['alerts'].append(f"{alert_prefix}: {component_health.get('error', 'Unknown error')}")
         
         return health_status
         
@@ -175,76 +306,70 @@ def display_health_indicator(status):
     
     return f'<span class="performance-indicator {status_class}"></span>{status.title()}'
 
+def show_metrics(metrics):
+    """Render (label, value) pairs as one row of st.metric columns"""
+    for col, (label, value) in zip(st.columns(len(metrics)), metrics):
+        col.metric(label, value)
+
 def run_enhanced_pipeline():
     """Run the complete enhanced pipeline with monitoring"""
     run_id = f"enhanced_{int(time.time())}"
-    
-    # Create progress tracking
-    progress_container = st.container()
-    
-    with progress_container:
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        metrics_placeholder = st.empty()
+    db, fetcher, processor = get_db(), get_fetcher(), get_processor()
     
     try:
-        # Phase 1: Data Ingestion
-        status_text.text("🔄 Phase 1/4: Enhanced data ingestion...")
-        progress_bar.progress(10)
-        
-        start_time = time.time()
-        articles = fetcher.run_full_fetch(run_id=run_id)
-        ingestion_time = time.time() - start_time
-        
-        if not articles:
-            st.error("No articles fetched. Check API connection and try again.")
-            return False
-        
-        progress_bar.progress(35)
-        
-        # Phase 2: Data Processing
-        status_text.text("🔄 Phase 2/4: Advanced processing and analysis...")
-        
-        processing_start = time.time()
-        processed_articles = processor.process_articles_batch(articles)
-        processing_time = time.time() - processing_start
-        
-        progress_bar.progress(65)
-        
-        # Phase 3: Data Storage
-        status_text.text("🔄 Phase 3/4: Storing with quality checks...")
-        
-        storage_start = time.time()
-        saved_count = db.save_articles_batch(processed_articles, run_id=run_id)
-        storage_time = time.time() - storage_start
-        
-        progress_bar.progress(90)
-        
-        # Phase 4: Quality Report
-        status_text.text("🔄 Phase 4/4: Generating quality report...")
-        
-        quality_report = processor.get_quality_report(processed_articles)
-        ingestion_metrics = fetcher.get_ingestion_metrics()
-        
-        progress_bar.progress(100)
+        # Each phase reports into the status container as it finishes, so
+        # partial results show up while the later phases are still running
+        with st.status("🔄 Phase 1/4: Enhanced data ingestion...", expanded=True) as status:
+            start_time = time.time()
+            articles = fetcher.run_full_fetch(
+                run_id=run_id,
+                progress_callback=lambda phase, count: status.write(f"{phase}: {count} articles")
+            )
+            ingestion_time = time.time() - start_time
+            
+            if not articles:
+                status.update(label="No articles fetched", state="error")
+                st.error("No articles fetched. Check API connection and try again.")
+                return False
+            
+            # Phase 2: Data Processing
+            status.update(label=f"🔄 Phase 2/4: Processing {len(articles)} articles...")
+            
+            processing_start = time.time()
+            processed_articles = processor.process_articles_batch(
+                articles,
+                progress_callback=lambda done, total: status.update(
+                    label=f"🔄 Phase 2/4: Processed {done}/{total} articles...")
+            )
+            processing_time = time.time() - processing_start
+            status.write(f"Processed: {len(processed_articles)} articles in {processing_time:.1f}s")
+            
+            # Phase 3: Data Storage
+            status.update(label="🔄 Phase 3/4: Storing with quality checks...")
+            
+            storage_start = time.time()
+            saved_count = db.save_articles_batch(processed_articles, run_id=run_id)
+            storage_time = time.time() - storage_start
+            status.write(f"Saved: {saved_count} articles in {storage_time:.1f}s")
+            
+            # Phase 4: Quality Report
+            status.update(label="🔄 Phase 4/4: Generating quality report...")
+            
+            quality_report = processor.get_quality_report(processed_articles)
+            ingestion_metrics = fetcher.get_ingestion_metrics()
+            
+            status.update(label="✅ Pipeline completed successfully!", state="complete", expanded=False)
         
         # Display comprehensive results
         total_time = time.time() - start_time
         
         # Success summary
-        success_col1, success_col2, success_col3, success_col4 = st.columns(4)
-        
-        with success_col1:
-            st.metric("Articles Processed", len(processed_articles))
-        
-        with success_col2:
-            st.metric("Articles Saved", saved_count)
-        
-        with success_col3:
-            st.metric("Success Rate", f"{ingestion_metrics['success_rate']:.1%}")
-        
-        with success_col4:
-            st.metric("Total Time", f"{total_time:.1f}s")
+        show_metrics([
+            ("Articles Processed", len(processed_articles)),
+            ("Articles Saved", saved_count),
+            ("Success Rate", f"{ingestion_metrics['success_rate']:.1%}"),
+            ("Total Time", f"{total_time:.1f}s")
+        ])
         
         # Detailed metrics
         with st.expander("📊 Detailed Pipeline Metrics"):
@@ -267,14 +392,9 @@ def run_enhanced_pipeline():
                 st.write(f"- Sentiment Analysis: {processing_metrics['sentiment_analysis_time']:.2f}s")
                 st.write(f"- Keyword Extraction: {processing_metrics['keyword_extraction_time']:.2f}s")
         
-        status_text.text("✅ Pipeline completed successfully!")
+        # Leave the summary on screen briefly before the caller reruns
         time.sleep(2)
         
-        # Clear progress indicators
-        progress_bar.empty()
-        status_text.empty()
-        metrics_placeholder.empty()
-        
         return True
         
     except Exception as e:
@@ -282,12 +402,12 @@ def run_enhanced_pipeline():
         st.error(f"Pipeline failed: {str(e)}")
         return False
 
-def display_advanced_analytics():
+def display_advanced_analytics(since=None):
     """Display advanced analytics and insights"""
     st.header("🧠 Advanced Analytics")
     
     # Get articles with enhanced features
-    articles_df = db.get_articles(limit=500, min_quality=0.6)
+    articles_df = load_articles(limit=500, min_quality=0.6, since=since)
     
     if articles_df.empty:
         st.warning("No high-quality articles found. Run the pipeline to generate data.")
@@ -313,50 +433,37 @@ def display_quality_analysis(articles_df):
     st.subheader("Data Quality Dashboard")
     
     # Quality metrics
-    quality_col1, quality_col2, quality_col3, quality_col4 = st.columns(4)
-    
-    with quality_col1:
-        avg_quality = articles_df['quality_score'].mean()
-        st.metric("Avg Quality Score", f"{avg_quality:.3f}")
-    
-    with quality_col2:
-        high_quality_count = len(articles_df[articles_df['quality_score'] >= 0.8])
-        st.metric("High Quality Articles", high_quality_count)
-    
-    with quality_col3:
-        unique_sources = articles_df['source'].nunique()
-        st.metric("Unique Sources", unique_sources)
-    
-    with quality_col4:
-        avg_readability = articles_df.get('readability_score', pd.Series([0.5])).mean()
-        st.metric("Avg Readability", f"{avg_readability:.3f}")
+    avg_quality = articles_df['quality_score'].mean()
+    high_quality_count = len(articles_df[articles_df['quality_score'] >= 0.8])
+    avg_readability = articles_df.get('readability_score', pd.Series([0.5])).mean()
+    show_metrics([
+        ("Avg Quality Score", f"{avg_quality:.3f}"),
+        ("High Quality Articles", high_quality_count),
+        ("Unique Sources", articles_df['source'].nunique()),
+        ("Avg Readability", f"{avg_readability:.3f}")
+    ])
     
     # Quality distribution
     col1, col2 = st.columns(2)
     
     with col1:
         # Quality score distribution
-        quality_bins = pd.cut(articles_df['quality_score'], 
-                             bins=[0, 0.5, 0.7, 0.9, 1.0], 
-                             labels=['Poor', 'Fair', 'Good', 'Excellent'])
-        quality_counts = quality_bins.value_counts()
-        
-        fig_quality = px.pie(
-            values=quality_counts.values,
-            names=quality_counts.index,
-            title="Quality Distribution",
-            color_discrete_map={
-                'Excellent': '#28a745',
-                'Good': '#17a2b8',
-                'Fair': '#ffc107',
-                'Poor': '#dc3545'
-            }
-        )
-        st.plotly_chart(fig_quality, use_container_width=True)
+        # Right-closed bins like pd.cut: searchsorted maps (0, 0.5] to 1,
+        # (0.5, 0.7] to 2 and so on; 0 and anything above 1.0 fall outside
+        bin_index = np.searchsorted(QUALITY_BIN_EDGES, articles_df['quality_score'].to_numpy(), side='left')
+        quality_counts = np.bincount(bin_index, minlength=len(QUALITY_BIN_EDGES) + 1)[1:len(QUALITY_BIN_EDGES)]
+        
+        fig_quality = go.Figure(go.Pie(
+            labels=QUALITY_LABELS,
+            values=quality_counts.tolist(),
+            marker_colors=[QUALITY_COLORS[label] for label in QUALITY_LABELS]
+        ))
+        fig_quality.update_layout(title_text="Quality Distribution")
+        show_chart(fig_quality)
     
     with col2:
         # Source quality comparison
-        source_quality = articles_df.groupby('source').agg({
+        source_quality = articles_df.groupby('source', observed=True).agg({
             'quality_score': 'mean',
             'title': 'count'
         }).round(3)
@@ -371,18 +478,13 @@ def display_quality_analysis(articles_df):
             labels={'x': 'Average Quality Score', 'y': 'Source'}
         )
         fig_source.update_layout(yaxis={'categoryorder': 'total ascending'})
-        st.plotly_chart(fig_source, use_container_width=True)
+        show_chart(fig_source)
     
-    # Quality over time
-    if 'created_at' in articles_df.columns:
+    # Quality over time, aggregated per day by the database
+    daily_quality = load_daily_quality(min_quality=0.6)
+    if not daily_quality.empty:
         st.subheader("Quality Trends Over Time")
         
-        articles_df['created_at'] = pd.to_datetime(articles_df['created_at'])
-        daily_quality = articles_df.groupby(articles_df['created_at'].dt.date).agg({
-            'quality_score': 'mean',
-            'title': 'count'
-        }).reset_index()
-        
         fig_timeline = make_subplots(
             rows=2, cols=1,
             subplot_titles=('Average Quality Score', 'Articles Per Day'),
@@ -390,27 +492,26 @@ def display_quality_analysis(articles_df):
         )
         
         fig_timeline.add_trace(
-            go.Scatter(x=daily_quality['created_at'], y=daily_quality['quality_score'],
-                      mode='lines+markers', name='Quality Score'),
+            go.Scattergl(x=daily_quality['day'], y=daily_quality['avg_quality'],
+                         mode='lines+markers', name='Quality Score'),
             row=1, col=1
         )
         
         fig_timeline.add_trace(
-            go.Bar(x=daily_quality['created_at'], y=daily_quality['title'],
+            go.Bar(x=daily_quality['day'], y=daily_quality['article_count'],
                    name='Article Count'),
             row=2, col=1
         )
         
         fig_timeline.update_layout(height=500, title_text="Quality and Volume Trends")
-        st.plotly_chart(fig_timeline, use_container_width=True)
+        show_chart(fig_timeline)
 
 def display_trending_analysis(articles_df):
     """Display trending topics analysis"""
     st.subheader("Trending Topics Analysis")
     
     # Get trending topics from processor
-    articles_list = articles_df.to_dict('records')
-    trending_topics = processor.detect_trending_topics(articles_list)
+    trending_topics = load_trending_topics(articles_df)
     
     if trending_topics:
         # Display top trending topics
@@ -430,7 +531,7 @@ def display_trending_analysis(articles_df):
                 labels={'trending_score': 'Trending Score', 'keyword': 'Keyword'}
             )
             fig_trending.update_layout(yaxis={'categoryorder': 'total ascending'})
-            st.plotly_chart(fig_trending, use_container_width=True)
+            show_chart(fig_trending)
         
         with trending_col2:
             st.write("**📊 Trending Details**")
@@ -461,8 +562,8 @@ def display_performance_metrics():
     st.subheader("System Performance Monitoring")
     
     # Get performance data
-    if db:
-        performance_df = db.get_performance_metrics()
+    if get_db():
+        performance_df = load_performance_metrics()
         
         if not performance_df.empty:
             perf_col1, perf_col2 = st.columns(2)
@@ -496,7 +597,7 @@ def display_performance_metrics():
                     title="Average Performance Metrics",
                     labels={'avg_value': 'Average Value', 'metric_name': 'Metric'}
                 )
-                st.plotly_chart(fig_perf, use_container_width=True)
+                show_chart(fig_perf)
             else:
                 st.info("Run the pipeline multiple times to see performance trends.")
         else:
@@ -509,8 +610,16 @@ def display_insights_dashboard(articles_df):
     # Generate insights
     insights = []
     
+    # Every predicate is computed from one read of each column
+    n_articles = len(articles_df)
+    sources = articles_df['source']
+    source_counts = sources.value_counts()
+    category_counts = articles_df['category'].value_counts()
+    low_quality_sources = sources[articles_df['quality_score'].to_numpy() < 0.6].value_counts()
+    low_quality_sources = low_quality_sources[low_quality_sources > 0]
+    negative_count = int((articles_df['sentiment_label'] == 'negative').sum())
+    
     # Quality insights
-    low_quality_sources = articles_df[articles_df['quality_score'] < 0.6]['source'].value_counts()
     if not low_quality_sources.empty:
         insights.append({
             'type': 'warning',
@@ -520,18 +629,16 @@ def display_insights_dashboard(articles_df):
         })
     
     # Sentiment insights
-    negative_sentiment = articles_df[articles_df['sentiment_label'] == 'negative']
-    if len(negative_sentiment) > len(articles_df) * 0.4:
+    if negative_count > n_articles * 0.4:
         insights.append({
             'type': 'warning',
             'title': 'High Negative Sentiment',
-            'message': f"{len(negative_sentiment)} articles ({len(negative_sentiment)/len(articles_df)*100:.1f}%) have negative sentiment",
+            'message': f"{negative_count} articles ({negative_count/n_articles*100:.1f}%) have negative sentiment",
             'action': 'Monitor for potential crisis or negative trend'
         })
     
     # Source diversity insights
-    source_counts = articles_df['source'].value_counts()
-    if source_counts.iloc[0] > len(articles_df) * 0.5:
+    if source_counts.iloc[0] > n_articles * 0.5:
         insights.append({
             'type': 'info',
             'title': 'Source Concentration',
@@ -540,13 +647,11 @@ def display_insights_dashboard(articles_df):
         })
     
     # Category insights
-    category_counts = articles_df['category'].value_counts()
-    dominant_category = category_counts.index[0]
-    if category_counts.iloc[0] > len(articles_df) * 0.4:
+    if category_counts.iloc[0] > n_articles * 0.4:
         insights.append({
             'type': 'info',
             'title': 'Category Dominance',
-            'message': f"40%+ of articles are about {dominant_category}",
+            'message': f"40%+ of articles are about {category_counts.index[0]}",
             'action': 'Current trend focus detected in this category'
         })
     
@@ -569,9 +674,99 @@ def display_insights_dashboard(articles_df):
     else:
         st.success("✅ No significant issues detected. System is performing well!")
 
+# Widget changes inside a fragment rerun only that fragment. st.fragment
+# arrived in Streamlit 1.37 (experimental_fragment in 1.33); older releases
+# fall back to a plain function and a full-page rerun.
+fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+@fragment
+def display_article_explorer(articles_df, max_articles):
+    """Display the searchable, filterable article table"""
+    st.header("📰 Article Explorer")
+    
+    # Enhanced search
+    search_col1, search_col2 = st.columns([3, 1])
+    
+    with search_col1:
+        search_term = st.text_input("🔍 Search articles", placeholder="Enter keywords...")
+    
+    with search_col2:
+        category_filter = st.selectbox("Category", ["All"] + list(articles_df['category'].unique()))
+    
+    # Apply filters; nothing below mutates the frame, so the unfiltered
+    # case shares articles_df instead of copying it
+    display_articles = articles_df
+    
+    if search_term:
+        search_results = search_articles(search_term, limit=max_articles)
+        if not search_results.empty:
+            display_articles = search_results
+        else:
+            st.info(f"No articles found for '{search_term}'")
+    
+    if category_filter != "All":
+        display_articles = display_articles[display_articles['category'] == category_filter]
+    
+    # Display articles as one table instead of a widget tree per article
+    display_articles = display_articles.head(50)
+    st.dataframe(
+        display_articles[['title', 'source', 'category', 'sentiment_label',
+                          'sentiment_score', 'quality_score', 'url']],
+        column_config={
+            'title': st.column_config.TextColumn("Title", width="large"),
+            'source': "Source",
+            'category': "Category",
+            'sentiment_label': "Sentiment",
+            'sentiment_score': st.column_config.ProgressColumn(
+                "Sentiment Score", format="%.3f", min_value=-1.0, max_value=1.0),
+            'quality_score': st.column_config.ProgressColumn(
+                "Quality Score", format="%.3f", min_value=0.0, max_value=1.0),
+            'url': st.column_config.LinkColumn("URL")
+        },
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    # Details are rendered for the selected article only
+    if not display_articles.empty:
+        selected = st.selectbox(
+            "Article details",
+            range(len(display_articles)),
+            format_func=lambda i: display_articles['title'].iloc[i][:100]
+        )
+        article = display_articles.iloc[selected]
+        
+        article_col1, article_col2 = st.columns([3, 1])
+        
+        with article_col1:
+            st.write(f"**Description:** {article['description']}")
+            st.write(f"**URL:** {article['url']}")
+            if article.get('keywords'):
+                st.write(f"**Keywords:** {article['keywords']}")
+            
+            if article.get('category_confidence'):
+                st.write(f"**Category Confidence:** {article['category_confidence']:.3f}")
+        
+        with article_col2:
+            sentiment = article['sentiment_label']
+            
+            if sentiment == 'positive':
+                st.success(f"😊 {sentiment.title()}")
+            elif sentiment == 'negative':
+                st.error(f"😞 {sentiment.title()}")
+            else:
+                st.info(f"😐 {sentiment.title()}")
+            
+            st.write(f"**Category:** {article['category']}")
+            
+            if article.get('processing_time'):
+                st.write(f"**Processing:** {article['processing_time']:.4f}s")
+
 def main():
     """Enhanced main dashboard function"""
     
+    config.init_logging()
+    
     # Header
     st.markdown("""
     <div class="main-header">
@@ -585,24 +780,19 @@ def main():
     
     health_status = get_system_health()
     
-    # Health overview
-    health_col1, health_col2, health_col3, health_col4 = st.columns(4)
-    
-    with health_col1:
-        overall_status = health_status['overall']
-        st.markdown(f"**Overall Status:** {display_health_indicator(overall_status)}", unsafe_allow_html=True)
-    
-    with health_col2:
-        db_status = health_status['components'].get('database', {}).get('status', 'unknown')
-        st.markdown(f"**Database:** {display_health_indicator(db_status)}", unsafe_allow_html=True)
-    
-    with health_col3:
-        api_status = health_status['components'].get('ingestion', {}).get('status', 'unknown')
-        st.markdown(f"**API:** {display_health_indicator(api_status)}", unsafe_allow_html=True)
-    
-    with health_col4:
-        proc_status = health_status['components'].get('processor', {}).get('status', 'unknown')
-        st.markdown(f"**Processor:** {display_health_indicator(proc_status)}", unsafe_allow_html=True)
+    # Health overview, sent to the frontend as a single element
+    components = health_status['components']
+    indicators = [("Overall Status", health_status['overall'])] + [
+        (label, components.get(name, {}).get('status', 'unknown'))
+        for label, name in (("Database", 'database'), ("API", 'ingestion'), ("Processor", 'processor'))
+    ]
+    st.markdown(
+        '<div style="display: flex; justify-content: space-between;">' +
+        ''.join(f"<div><strong>{label}:</strong> {display_health_indicator(status)}</div>"
+                for label, status in indicators) +
+        '</div>',
+        unsafe_allow_html=True
+    )
     
     # Alerts
     if health_status['alerts']:
@@ -617,12 +807,15 @@ def main():
     if st.sidebar.button("🚀 Run Enhanced Pipeline", type="primary"):
         with st.spinner("Running enhanced pipeline..."):
             if run_enhanced_pipeline():
+                # New rows were written, drop the cached query results
+                st.cache_data.clear()
                 st.rerun()
     
     # Quick actions
     st.sidebar.subheader("Quick Actions")
     
     if st.sidebar.button("🔄 Refresh Data"):
+        st.cache_data.clear()
         st.rerun()
     
     if st.sidebar.button("🧹 Clear Cache"):
@@ -633,9 +826,10 @@ def main():
     # Real-time processing toggle
     st.sidebar.subheader("Real-time Processing")
     
-    if config.REALTIME_CONFIG['enabled']:
+    if config.REALTIME_CONFIG.enabled:
         realtime_status = "🟢 Available"
         if st.sidebar.button("▶️ Start Real-time"):
+            fetcher = get_fetcher()
             if fetcher:
                 def realtime_callback(articles):
                     logger.info(f"Real-time processing: {len(articles)} articles")
@@ -644,6 +838,7 @@ def main():
                 st.sidebar.success("Real-time processing started!")
         
         if st.sidebar.button("⏹️ Stop Real-time"):
+            fetcher = get_fetcher()
             if fetcher:
                 fetcher.stop_realtime_processing()
                 st.sidebar.success("Real-time processing stopped!")
@@ -659,18 +854,17 @@ def main():
     min_quality = st.sidebar.slider("Min Quality Score", 0.0, 1.0, 0.5, 0.1)
     
     # Time range filter
-    time_range = st.sidebar.selectbox(
-        "Time Range",
-        ["Last 24 hours", "Last 3 days", "Last 7 days", "Last 30 days", "All time"]
-    )
+    time_range = st.sidebar.selectbox("Time Range", list(TIME_RANGES))
     
     # Main Content
-    if not db or not fetcher or not processor:
+    # The tabs below read through the database and the processor only
+    if not get_db() or not get_processor():
         st.error("System components not properly initialized. Please check logs.")
         return
     
     # Get articles
-    articles_df = db.get_articles(limit=max_articles, min_quality=min_quality)
+    since = time_range_start(time_range)
+    articles_df = load_articles(limit=max_articles, min_quality=min_quality, since=since)
     
     if articles_df.empty:
         st.warning("📭 No articles found. Run the enhanced pipeline to fetch and process news data!")
@@ -678,28 +872,20 @@ def main():
         return
     
     # Enhanced Analytics
-    display_advanced_analytics()
+    display_advanced_analytics(since=since)
     
     # Traditional Dashboard Components
     st.header("📊 Overview Dashboard")
     
     # Key metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Total Articles", len(articles_df))
-    
-    with col2:
-        avg_sentiment = articles_df['sentiment_score'].mean()
-        st.metric("Avg Sentiment", f"{avg_sentiment:.3f}")
-    
-    with col3:
-        unique_sources = articles_df['source'].nunique()
-        st.metric("News Sources", unique_sources)
-    
-    with col4:
-        avg_quality = articles_df.get('quality_score', pd.Series([0.5])).mean()
-        st.metric("Avg Quality", f"{avg_quality:.3f}")
+    avg_sentiment = articles_df['sentiment_score'].mean()
+    avg_quality = articles_df.get('quality_score', pd.Series([0.5])).mean()
+    show_metrics([
+        ("Total Articles", len(articles_df)),
+        ("Avg Sentiment", f"{avg_sentiment:.3f}"),
+        ("News Sources", articles_df['source'].nunique()),
+        ("Avg Quality", f"{avg_quality:.3f}")
+    ])
     
     # Sentiment Analysis
     st.header("💭 Sentiment Analysis")
@@ -709,107 +895,31 @@ def main():
     with col1:
         sentiment_counts = articles_df['sentiment_label'].value_counts()
         
-        fig_pie = px.pie(
-            values=sentiment_counts.values,
-            names=sentiment_counts.index,
-            title="Sentiment Distribution",
-            color_discrete_map={
-                'positive': '#28a745',
-                'negative': '#dc3545',
-                'neutral': '#6c757d'
-            }
-        )
-        st.plotly_chart(fig_pie, use_container_width=True)
+        fig_pie = go.Figure(go.Pie(
+            labels=sentiment_counts.index.tolist(),
+            values=sentiment_counts.values.tolist(),
+            marker_colors=[SENTIMENT_COLORS.get(label) for label in sentiment_counts.index]
+        ))
+        fig_pie.update_layout(title_text="Sentiment Distribution")
+        show_chart(fig_pie)
     
     with col2:
-        # Enhanced sentiment over time
-        if 'created_at' in articles_df.columns:
-            articles_df['created_at'] = pd.to_datetime(articles_df['created_at'])
-            sentiment_time = articles_df.groupby([
-                articles_df['created_at'].dt.date,
-                'sentiment_label'
-            ]).size().reset_index(name='count')
-            
+        # Enhanced sentiment over time, aggregated per day by the database
+        sentiment_time = load_daily_sentiment_counts(min_quality=min_quality)
+        if not sentiment_time.empty:
             fig_line = px.line(
                 sentiment_time,
-                x='created_at',
+                x='day',
                 y='count',
                 color='sentiment_label',
                 title="Sentiment Trends Over Time",
-                color_discrete_map={
-                    'positive': '#28a745',
-                    'negative': '#dc3545',
-                    'neutral': '#6c757d'
-                }
+                render_mode='webgl',
+                color_discrete_map=SENTIMENT_COLORS
             )
-            st.plotly_chart(fig_line, use_container_width=True)
+            show_chart(fig_line)
     
     # Article Search and Display
-    st.header("📰 Article Explorer")
-    
-    # Enhanced search
-    search_col1, search_col2 = st.columns([3, 1])
-    
-    with search_col1:
-        search_term = st.text_input("🔍 Search articles", placeholder="Enter keywords...")
-    
-    with search_col2:
-        category_filter = st.selectbox("Category", ["All"] + list(articles_df['category'].unique()))
-    
-    # Apply filters
-    display_articles = articles_df.copy()
-    
-    if search_term:
-        search_results = db.search_articles(search_term, limit=max_articles)
-        if not search_results.empty:
-            display_articles = search_results
-        else:
-            st.info(f"No articles found for '{search_term}'")
-    
-    if category_filter != "All":
-        display_articles = display_articles[display_articles['category'] == category_filter]
-    
-    # Display articles with enhanced information
-    for idx, article in display_articles.head(50).iterrows():
-        with st.expander(f"📄 {article['title'][:100]}... | {article['source']}"):
-            
-            article_col1, article_col2 = st.columns([3, 1])
-            
-            with article_col1:
-                st.write(f"**Description:** {article['description']}")
-                st.write(f"**URL:** {article['url']}")
-                if article.get('keywords'):
-                    st.write(f"**Keywords:** {article['keywords']}")
-                
-                # Enhanced metadata
-                if article.get('quality_score'):
-                    st.write(f"**Quality Score:** {article['quality_score']:.3f}")
-                
-                if article.get('category_confidence'):
-                    st.write(f"**Category Confidence:** {article['category_confidence']:.3f}")
-            
-            with article_col2:
-                # Sentiment with enhanced display
-                sentiment = article['sentiment_label']
-                score = article['sentiment_score']
-                confidence = article.get('sentiment_confidence', 0)
-                
-                if sentiment == 'positive':
-                    st.success(f"😊 {sentiment.title()}")
-                elif sentiment == 'negative':
-                    st.error(f"😞 {sentiment.title()}")
-                else:
-                    st.info(f"😐 {sentiment.title()}")
-                
-                st.write(f"**Score:** {score:.3f}")
-                if confidence:
-                    st.write(f"**Confidence:** {confidence:.3f}")
-                
-                st.write(f"**Category:** {article['category']}")
-                
-                # Processing info
-                if article.get('processing_time'):
-                    st.write(f"**Processing:** {article['processing_time']:.4f}s")
+    display_article_explorer(articles_df, max_articles)
     
     # Footer with system info
     st.markdown("---")
@@ -826,8 +936,8 @@ def main():
         st.markdown(f"*Environment: {config.ENVIRONMENT}*")
     
     # Auto-refresh
-    if st.sidebar.checkbox("🔄 Auto-refresh") and config.DASHBOARD_CONFIG['auto_refresh']:
-        time.sleep(config.DASHBOARD_CONFIG['refresh_interval'])
+    if st.sidebar.checkbox("🔄 Auto-refresh") and config.DASHBOARD_CONFIG.auto_refresh:
+        time.sleep(config.DASHBOARD_CONFIG.refresh_interval)
         st.rerun()
 
 if __name__ == "__main__":
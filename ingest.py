@@ -3,21 +3,87 @@ Enhanced data ingestion with real-time processing, monitoring, and cloud support
 Includes retry logic, concurrent processing, and performance monitoring
 """
 
-import requests
 import time
 import asyncio
 import aiohttp
 import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import itertools
 import logging
 import threading
-from dataclasses import dataclass
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from email.utils import parsedate_to_datetime
+from dataclasses import dataclass, field
 import config
 
+try:
+    import orjson
+except ImportError:  # faster JSON decoding is optional, stdlib json is the fallback
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause
+# covers both parsers
+json_loads = orjson.loads if orjson else json.loads
+
 logger = logging.getLogger(__name__)
 
+# Config values used on the request path, resolved once at import (the config
+# objects are frozen, so changing them requires a process restart anyway)
+_MAX_PER_CATEGORY = config.PROCESSING_CONFIG.max_articles_per_category
+_MAX_PER_TOPIC = config.PROCESSING_CONFIG.max_articles_per_topic
+_MAX_PER_RUN = config.PROCESSING_CONFIG.max_articles_per_run
+_API_RATE_LIMIT = config.PROCESSING_CONFIG.api_rate_limit
+_MAX_RETRIES = config.PROCESSING_CONFIG.max_retries
+_RETRY_DELAY = config.PROCESSING_CONFIG.retry_delay
+_MAX_RETRY_AFTER = config.PROCESSING_CONFIG.max_retry_after
+_TIMEOUT = config.get_performance_config()['timeout']
+
+# Raw API responses kept in NewsFetcher's TTL cache
+RESPONSE_CACHE_SIZE = 256
+
+# Seconds an API health probe result is reused before probing again
+HEALTH_PROBE_TTL = 30
+
+# Query parameters that only track the referrer and never identify an article
+TRACKING_PARAMS = frozenset({'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ocid', 'ref'})
+
+def retry_after_seconds(headers):
+    """Seconds to wait from a Retry-After header (delta or HTTP date), or None"""
+    value = headers.get('Retry-After') if headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+def canonical_url(url):
+    """Normalize a URL for duplicate detection
+    
+    Lowercases scheme and host, drops the fragment and tracking parameters
+    (utm_* and TRACKING_PARAMS), so syndicated copies of one article compare
+    equal while query parameters that identify content are kept. A URL
+    urlsplit rejects (e.g. a malformed IPv6 host) is keyed as-is.
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    query = parts.query
+    if query:
+        query = urlencode([
+            (key, value) for key, value in parse_qsl(query, keep_blank_values=True)
+            if not key.startswith('utm_') and key not in TRACKING_PARAMS
+        ])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
 @dataclass
 class IngestionMetrics:
     """Track ingestion performance metrics"""
@@ -28,6 +94,28 @@ class IngestionMetrics:
     processing_time: float = 0.0
     rate_limit_hits: int = 0
     retries_attempted: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    
+    def add(self, **increments):
+        """Apply counter increments together under the metrics lock"""
+        with self._lock:
+            for name, amount in increments.items():
+                setattr(self, name, getattr(self, name) + amount)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Consistent copy of all counters plus the derived rates"""
+        with self._lock:
+            return {
+                'total_requests': self.total_requests,
+                'successful_requests': self.successful_requests,
+                'failed_requests': self.failed_requests,
+                'success_rate': self.success_rate(),
+                'total_articles': self.total_articles,
+                'processing_time': self.processing_time,
+                'articles_per_second': self.articles_per_second(),
+                'rate_limit_hits': self.rate_limit_hits,
+                'retries_attempted': self.retries_attempted
+            }
     
     def success_rate(self) -> float:
         return (self.successful_requests / self.total_requests) if self.total_requests > 0 else 0.0
@@ -40,225 +128,377 @@ class NewsFetcher:
         self.api_key = config.API_KEY
         self.base_url = config.BASE_URL
         self.metrics = IngestionMetrics()
-        self.session = requests.Session()
-        self.session.headers.update({
+        
+        # Endpoint URLs and the parameters every request shares, built once;
+        # per-call params are merged over a copy so nothing shared is mutated
+        self._headlines_url = f"{self.base_url}/top-headlines"
+        self._search_url = f"{self.base_url}/search"
+        self._base_params = {'lang': 'en', 'country': 'us', 'apikey': self.api_key}
+        self.headers = {
             'User-Agent': 'NewsIntelligence/1.0 (Professional Data Pipeline)',
             'Accept': 'application/json',
             'Connection': 'keep-alive'
-        })
+        }
+        
+        # All HTTP goes through one aiohttp session on an event loop owned by
+        # this fetcher; the loop runs in a daemon thread so the synchronous
+        # API below can be called from any thread (dashboard, realtime loop)
+        self._loop = None
+        self._loop_lock = threading.Lock()
+        self.session = None
+        
+        # Raw JSON responses keyed on (url, sorted params), stored as
+        # (data, expiry); a hit does not extend the expiry
+        self._response_cache = {}
+        self._response_cache_ttl = config.DASHBOARD_CONFIG.refresh_interval
         
-        # Rate limiting
-        self.last_request_time = 0
-        self.rate_limit_lock = threading.Lock()
+        # Rate limiting: monotonic time of the next free request slot; the
+        # semaphore is created with each event loop
+        self._next_slot = 0.0
+        self._request_semaphore = None
         
         # Real-time processing
-        self.realtime_enabled = config.REALTIME_CONFIG['enabled']
-        self.realtime_interval = config.REALTIME_CONFIG['interval_minutes']
+        self.realtime_enabled = config.REALTIME_CONFIG.enabled
+        self.realtime_interval = config.REALTIME_CONFIG.interval_minutes
         self.realtime_running = False
+        # Set to stop the realtime loop; also serves as its interruptible sleep
+        self._stop_event = threading.Event()
+        
+        # Last API probe outcome and when it was taken (monotonic)
+        self._health_probe = None
+        self._health_probe_ts = 0.0
+        
+        # Conditional refresh: newest publishedAt and the articles from the
+        # last full fetch, keyed by 'category:<name>' or 'topic:<query>'
+        self._last_seen_ts: Dict[str, str] = {}
+        self._last_articles: Dict[str, List[Dict]] = {}
         
         logger.info(f"News fetcher initialized - Real-time: {self.realtime_enabled}")
     
-    def _enforce_rate_limit(self):
-        """Enforce API rate limiting with thread safety"""
-        with self.rate_limit_lock:
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
-            
-            if time_since_last < config.PROCESSING_CONFIG['api_rate_limit']:
-                sleep_time = config.PROCESSING_CONFIG['api_rate_limit'] - time_since_last
-                time.sleep(sleep_time)
-                self.metrics.rate_limit_hits += 1
-            
-            self.last_request_time = time.time()
+    def _run(self, coro):
+        """Run a coroutine on the fetcher's event loop and wait for its result"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._request_semaphore = asyncio.Semaphore(config.REALTIME_CONFIG.max_concurrent_requests)
+                threading.Thread(target=self._loop.run_forever, name='news-fetch-loop', daemon=True).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+    
+    async def _get_session(self):
+        """Create the shared aiohttp session on first use"""
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, limit_per_host=10, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=_TIMEOUT),
+                headers=self.headers
+            )
+        return self.session
+    
+    def close(self):
+        """Close the shared HTTP session and stop the fetcher's event loop"""
+        with self._loop_lock:
+            if self._loop is None:
+                return
+            if self.session is not None:
+                asyncio.run_coroutine_threadsafe(self.session.close(), self._loop).result()
+                self.session = None
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+    
+    async def _enforce_rate_limit(self):
+        """Enforce API rate limiting across concurrent requests
+        
+        Leaky bucket: each caller reserves the next slot and then waits for it
+        on its own, so one caller's sleep never holds up the others. The
+        reservation has no await in it, which makes it atomic on the loop.
+        """
+        now = time.monotonic()
+        slot = max(self._next_slot, now)
+        self._next_slot = slot + _API_RATE_LIMIT
+        
+        if slot > now:
+            self.metrics.add(rate_limit_hits=1)
+            await asyncio.sleep(slot - now)
+    
+    def _cache_get(self, key):
+        """Return a cached response that has not expired, or None"""
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del self._response_cache[key]
+            return None
+        return entry[0]
+    
+    def _cache_put(self, key, data):
+        """Store a response, evicting the oldest entry when full"""
+        if len(self._response_cache) >= RESPONSE_CACHE_SIZE:
+            self._response_cache.pop(next(iter(self._response_cache)))
+        self._response_cache[key] = (data, time.monotonic() + self._response_cache_ttl)
     
-    def _make_request_with_retry(self, url: str, params: Dict[str, Any], 
-                               max_retries: int = None) -> Optional[Dict[str, Any]]:
+    async def _make_request_with_retry(self, url: str, params: Dict[str, Any], 
+                                       max_retries: int = None,
+                                       use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """Make HTTP request with retry logic and monitoring"""
         if max_retries is None:
-            max_retries = config.PROCESSING_CONFIG['max_retries']
-        
-        self._enforce_rate_limit()
-        
-        # Add API key to parameters
-        params['apikey'] = self.api_key
-        
-        for attempt in range(max_retries + 1):
-            try:
-                self.metrics.total_requests += 1
-                
-                logger.debug(f"API Request (attempt {attempt + 1}): {url}")
-                logger.debug(f"Parameters: {params}")
-                
-                response = self.session.get(
-                    url, 
-                    params=params, 
-                    timeout=config.get_performance_config()['timeout']
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                self.metrics.successful_requests += 1
-                
-                # Log response metrics
-                total_articles = data.get('totalArticles', 0)
-                articles_returned = len(data.get('articles', []))
-                
-                logger.info(f"API Success: {articles_returned} articles returned (total available: {total_articles})")
-                
-                return data
-                
-            except requests.exceptions.Timeout:
-                logger.warning(f"Request timeout (attempt {attempt + 1}/{max_retries + 1})")
-                if attempt < max_retries:
-                    self.metrics.retries_attempted += 1
-                    time.sleep(config.PROCESSING_CONFIG['retry_delay'] * (attempt + 1))
-                    continue
+            max_retries = _MAX_RETRIES
+        
+        # Identical requests within the TTL are answered without the network
+        cache_key = (url, tuple(sorted(params.items())))
+        if use_cache:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.debug(f"Response cache hit: {url}")
+                return cached
+        
+        # Admission control: at most max_concurrent_requests requests are in
+        # flight, which keeps bulk fan-outs under the API rate limit
+        async with self._request_semaphore:
+            await self._enforce_rate_limit()
+            
+            for attempt in range(max_retries + 1):
+                try:
+                    self.metrics.add(total_requests=1)
+                    
+                    logger.debug(f"API Request (attempt {attempt + 1}): {url}")
+                    logger.debug(f"Parameters: {params}")
                     
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 429:  # Rate limit
-                    logger.warning(f"Rate limit hit (attempt {attempt + 1}/{max_retries + 1})")
+                    session = await self._get_session()
+                    async with session.get(url, params=params) as response:
+                        response.raise_for_status()
+                        data = json_loads(await response.read())
+                    self.metrics.add(successful_requests=1)
+                    
+                    # Log response metrics
+                    total_articles = data.get('totalArticles', 0)
+                    articles_returned = len(data.get('articles', []))
+                    
+                    logger.info(f"API Success: {articles_returned} articles returned (total available: {total_articles})")
+                    
+                    self._cache_put(cache_key, data)
+                    return data
+                    
+                except asyncio.TimeoutError:
+                    logger.warning(f"Request timeout (attempt {attempt + 1}/{max_retries + 1})")
                     if attempt < max_retries:
-                        self.metrics.retries_attempted += 1
-                        time.sleep(config.PROCESSING_CONFIG['retry_delay'] * (attempt + 1) * 2)
+                        self.metrics.add(retries_attempted=1)
+                        await asyncio.sleep(_RETRY_DELAY * (attempt + 1))
                         continue
-                else:
-                    logger.error(f"HTTP Error {e.response.status_code}: {e}")
+                        
+                except aiohttp.ClientResponseError as e:
+                    if e.status in (429, 503):  # Rate limit / temporarily unavailable
+                        logger.warning(f"HTTP {e.status}, retryable (attempt {attempt + 1}/{max_retries + 1})")
+                        if attempt < max_retries:
+                            self.metrics.add(retries_attempted=1)
+                            # Prefer the server's own hint over blind backoff,
+                            # but the wait holds a request slot, so a hint past
+                            # MAX_RETRY_AFTER fails the request instead
+                            delay = retry_after_seconds(e.headers)
+                            if delay is None:
+                                delay = _RETRY_DELAY * (attempt + 1) * 2
+                            elif delay > _MAX_RETRY_AFTER:
+                                logger.error(f"HTTP {e.status}: Retry-After of {delay:.0f}s exceeds "
+                                             f"the {_MAX_RETRY_AFTER:.0f}s limit, giving up")
+                                break
+                            else:
+                                delay = max(_RETRY_DELAY, delay)
+                            await asyncio.sleep(delay)
+                            continue
+                    else:
+                        logger.error(f"HTTP Error {e.status}: {e}")
+                        break
+                        
+                except aiohttp.ClientError as e:
+                    logger.error(f"Request failed: {e}")
+                    if attempt < max_retries:
+                        self.metrics.add(retries_attempted=1)
+                        await asyncio.sleep(_RETRY_DELAY * (attempt + 1))
+                        continue
+                        
+                except json.JSONDecodeError as e:
+                    logger.error(f"JSON parsing failed: {e}")
                     break
                     
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Request failed: {e}")
-                if attempt < max_retries:
-                    self.metrics.retries_attempted += 1
-                    time.sleep(config.PROCESSING_CONFIG['retry_delay'] * (attempt + 1))
-                    continue
-                    
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON parsing failed: {e}")
-                break
-                
-            except Exception as e:
-                logger.error(f"Unexpected error: {e}")
-                break
-        
-        self.metrics.failed_requests += 1
-        return None
+                except Exception as e:
+                    logger.error(f"Unexpected error: {e}")
+                    break
+            
+            self.metrics.add(failed_requests=1)
+            return None
     
     def fetch_headlines(self, category='general', max_articles=50):
         """Get top headlines from a category with enhanced error handling"""
-        url = f"{self.base_url}/top-headlines"
+        return self._run(self._fetch_headlines_async(category, max_articles))
+    
+    async def _fetch_headlines_async(self, category, max_articles, use_cache=True):
+        url = self._headlines_url
         
         params = {
+            **self._base_params,
             'category': category,
-            'lang': 'en',
-            'country': 'us',
-            'max': min(max_articles, config.PROCESSING_CONFIG['max_articles_per_category'])
+            'max': min(max_articles, _MAX_PER_CATEGORY)
         }
         
         start_time = time.time()
-        response = self._make_request_with_retry(url, params)
+        response = await self._make_request_with_retry(url, params, use_cache=use_cache)
         processing_time = time.time() - start_time
         
         if not response:
             return []
         
         articles = response.get('articles', [])
-        processed_articles = []
+        processed_articles = self._process_articles(articles, category)
         
-        for article in articles:
-            processed = self._process_article(article, category)
-            if processed:
-                processed_articles.append(processed)
-        
-        self.metrics.total_articles += len(processed_articles)
-        self.metrics.processing_time += processing_time
+        self.metrics.add(total_articles=len(processed_articles), processing_time=processing_time)
         
         logger.info(f"Fetched {len(processed_articles)} articles from {category} in {processing_time:.2f}s")
         return processed_articles
     
     def search_news(self, query, max_articles=30):
         """Search for news with enhanced monitoring"""
-        url = f"{self.base_url}/search"
+        return self._run(self._search_news_async(query, max_articles))
+    
+    async def _search_news_async(self, query, max_articles, use_cache=True):
+        url = self._search_url
         
         params = {
+            **self._base_params,
             'q': query,
-            'lang': 'en',
-            'country': 'us',
-            'max': min(max_articles, config.PROCESSING_CONFIG['max_articles_per_topic']),
+            'max': min(max_articles, _MAX_PER_TOPIC),
             'sortby': 'publishedAt'
         }
         
         start_time = time.time()
-        response = self._make_request_with_retry(url, params)
+        response = await self._make_request_with_retry(url, params, use_cache=use_cache)
         processing_time = time.time() - start_time
         
         if not response:
             return []
         
         articles = response.get('articles', [])
-        processed_articles = []
+        processed_articles = self._process_articles(articles, 'search')
         
-        for article in articles:
-            processed = self._process_article(article, 'search')
-            if processed:
-                processed_articles.append(processed)
-        
-        self.metrics.total_articles += len(processed_articles)
-        self.metrics.processing_time += processing_time
+        self.metrics.add(total_articles=len(processed_articles), processing_time=processing_time)
         
         logger.info(f"Found {len(processed_articles)} articles for '{query}' in {processing_time:.2f}s")
         return processed_articles
     
+    def _headlines_if_changed(self, category):
+        params = {**self._base_params, 'category': category}
+        return self._fetch_if_changed(
+            f"category:{category}", self._headlines_url, params,
+            lambda: self._fetch_headlines_async(category, _MAX_PER_CATEGORY, use_cache=False)
+        )
+    
+    def _search_if_changed(self, query):
+        params = {**self._base_params, 'q': query, 'sortby': 'publishedAt'}
+        return self._fetch_if_changed(
+            f"topic:{query}", self._search_url, params,
+            lambda: self._search_news_async(query, _MAX_PER_TOPIC, use_cache=False)
+        )
+    
+    async def _fetch_if_changed(self, key, url, params, fetch):
+        """Reuse the last articles for key unless a newer one was published
+        
+        Issues a max=1 probe and compares the newest publishedAt with the one
+        recorded at the last full fetch; only on a change (or with nothing
+        recorded) is fetch() awaited, bypassing the response cache.
+        """
+        probe = await self._make_request_with_retry(url, {**params, 'max': 1}, use_cache=False)
+        newest = None
+        if probe and probe.get('articles'):
+            newest = probe['articles'][0].get('publishedAt')
+        
+        if newest and newest == self._last_seen_ts.get(key):
+            cached = self._last_articles[key]
+            logger.info(f"No new articles for {key}; reusing {len(cached)} cached articles")
+            return list(cached)
+        
+        articles = await fetch()
+        if newest and articles:
+            self._last_seen_ts[key] = newest
+            self._last_articles[key] = articles
+        return articles
+    
     def _process_article(self, article, category):
         """Process article with enhanced validation and monitoring"""
-        try:
-            source_info = article.get('source', {})
-            
-            # Enhanced validation
-            if not article.get('title'):
-                logger.debug("Skipping article: missing title")
-                return None
-            
-            if not article.get('url'):
-                logger.debug("Skipping article: missing URL")
-                return None
-            
-            # Process published date with better handling
-            published_at = article.get('publishedAt', '')
-            if published_at:
-                try:
-                    dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                    published_at = dt.strftime('%Y-%m-%d %H:%M:%S')
-                except (ValueError, TypeError):
-                    logger.warning(f"Invalid date format: {published_at}")
-                    published_at = config.get_timestamp()
-            else:
-                published_at = config.get_timestamp()
-            
-            processed = {
-                'title': article.get('title', '').strip()[:config.DATA_QUALITY['max_title_length']],
-                'description': article.get('description', '').strip()[:config.DATA_QUALITY['max_description_length']],
-                'url': article.get('url', '').strip(),
-                'source': source_info.get('name', 'Unknown').strip(),
-                'published_at': published_at,
-                'category': category,
-                'image_url': article.get('image', ''),
-                'fetch_timestamp': config.get_timestamp(),
-                'api_response_time': time.time()
-            }
-            
-            # Additional validation
-            if len(processed['title']) < config.DATA_QUALITY['min_title_length']:
-                logger.debug(f"Skipping article: title too short ({len(processed['title'])} chars)")
-                return None
-            
-            return processed
-            
-        except Exception as e:
-            logger.error(f"Error processing article: {e}")
-            return None
+        processed = self._process_articles([article], category)
+        return processed[0] if processed else None
+    
+    def _process_articles(self, articles, category):
+        """Validate and normalize a response's articles in one pass
+        
+        The fetch timestamp and the quality limits are read once per batch
+        rather than once per article.
+        """
+        now = config.get_timestamp()
+        received = time.time()
+        max_title = config.DATA_QUALITY.max_title_length
+        max_description = config.DATA_QUALITY.max_description_length
+        min_title = config.DATA_QUALITY.min_title_length
+        
+        processed_articles = []
+        for article in articles:
+            try:
+                # Enhanced validation
+                title = article.get('title')
+                if not title:
+                    logger.debug("Skipping article: missing title")
+                    continue
+                
+                url = article.get('url')
+                if not url:
+                    logger.debug("Skipping article: missing URL")
+                    continue
+                
+                # GNews sends 'YYYY-MM-DDTHH:MM:SSZ'; reformat that by slicing
+                # and only fall back to a full ISO parse for anything else
+                published_at = article.get('publishedAt', '')
+                if not published_at:
+                    published_at = now
+                elif len(published_at) == 20 and published_at[10] == 'T' and published_at[19] == 'Z':
+                    published_at = published_at[:10] + ' ' + published_at[11:19]
+                else:
+                    try:
+                        dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
+                        published_at = dt.strftime('%Y-%m-%d %H:%M:%S')
+                    except (ValueError, TypeError):
+                        logger.warning(f"Invalid date format: {published_at}")
+                        published_at = now
+                
+                title = title.strip()[:max_title]
+                
+                # Additional validation
+                if len(title) < min_title:
+                    logger.debug(f"Skipping article: title too short ({len(title)} chars)")
+                    continue
+                
+                processed_articles.append({
+                    'title': title,
+                    'description': article.get('description', '').strip()[:max_description],
+                    'url': url.strip(),
+                    'source': article.get('source', {}).get('name', 'Unknown').strip(),
+                    'published_at': published_at,
+                    'category': category,
+                    'image_url': article.get('image', ''),
+                    'fetch_timestamp': now,
+                    'api_response_time': received
+                })
+                
+            except Exception as e:
+                logger.error(f"Error processing article: {e}")
+        
+        return processed_articles
     
-    def fetch_concurrent_categories(self, categories=None, max_articles_per_category=20):
-        """Fetch multiple categories concurrently for better performance"""
+    def fetch_concurrent_categories(self, categories=None, max_articles_per_category=20, seen=None):
+        """Fetch multiple categories concurrently for better performance
+        
+        Articles whose canonical URL is already in seen are dropped as results
+        arrive; pass the same set to several fetches to dedupe across them.
+        """
+        return self._run(self._fetch_categories_async(categories, max_articles_per_category, seen))
+    
+    async def _fetch_categories_async(self, categories, max_articles_per_category, seen=None):
         if categories is None:
             categories = config.CATEGORIES
         
@@ -266,31 +506,27 @@ class NewsFetcher:
         start_time = time.time()
         
         all_articles = []
+        if seen is None:
+            seen = set()
         
-        with ThreadPoolExecutor(max_workers=config.get_performance_config()['max_workers']) as executor:
-            # Submit all category fetches
-            future_to_category = {
-                executor.submit(self.fetch_headlines, category, max_articles_per_category): category
-                for category in categories
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_category):
-                category = future_to_category[future]
-                try:
-                    articles = future.result()
-                    all_articles.extend(articles)
-                    logger.info(f"Completed fetch for category: {category} ({len(articles)} articles)")
-                except Exception as e:
-                    logger.error(f"Error fetching category {category}: {e}")
+        # All category requests overlap on the event loop
+        results = await asyncio.gather(
+            *[self._fetch_headlines_async(category, max_articles_per_category) for category in categories],
+            return_exceptions=True
+        )
+        
+        self._collect_results('category', categories, results, seen, all_articles)
         
         total_time = time.time() - start_time
         logger.info(f"Concurrent fetch complete: {len(all_articles)} articles in {total_time:.2f}s")
         
         return all_articles
     
-    def search_concurrent_topics(self, topics=None, max_articles_per_topic=25):
-        """Search multiple topics concurrently"""
+    def search_concurrent_topics(self, topics=None, max_articles_per_topic=25, seen=None):
+        """Search multiple topics concurrently, deduplicating against seen"""
+        return self._run(self._search_topics_async(topics, max_articles_per_topic, seen))
+    
+    async def _search_topics_async(self, topics, max_articles_per_topic, seen=None):
         if topics is None:
             topics = config.SEARCH_TOPICS
         
@@ -298,51 +534,94 @@ class NewsFetcher:
         start_time = time.time()
         
         all_articles = []
+        if seen is None:
+            seen = set()
         
-        with ThreadPoolExecutor(max_workers=config.get_performance_config()['max_workers']) as executor:
-            # Submit all topic searches
-            future_to_topic = {
-                executor.submit(self.search_news, topic, max_articles_per_topic): topic
-                for topic in topics
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_topic):
-                topic = future_to_topic[future]
-                try:
-                    articles = future.result()
-                    all_articles.extend(articles)
-                    logger.info(f"Completed search for topic: {topic} ({len(articles)} articles)")
-                except Exception as e:
-                    logger.error(f"Error searching topic {topic}: {e}")
+        # All topic searches overlap on the event loop
+        results = await asyncio.gather(
+            *[self._search_news_async(topic, max_articles_per_topic) for topic in topics],
+            return_exceptions=True
+        )
         
-        # Remove duplicates
-        unique_articles = self._remove_duplicates(all_articles)
+        self._collect_results('topic', topics, results, seen, all_articles)
         
         total_time = time.time() - start_time
-        logger.info(f"Concurrent search complete: {len(unique_articles)} unique articles in {total_time:.2f}s")
+        logger.info(f"Concurrent search complete: {len(all_articles)} unique articles in {total_time:.2f}s")
         
-        return unique_articles
+        return all_articles
     
-    def _remove_duplicates(self, articles):
-        """Remove duplicate articles efficiently"""
-        seen_urls = set()
-        unique_articles = []
+    async def _full_fetch_async(self, seen, conditional=False):
+        """Fetch every category and topic in a single gather
+        
+        Both kinds share the rate limiter and request semaphore, so scheduling
+        them together keeps every admission slot busy instead of draining the
+        categories before the first topic search starts. Results are collected
+        in a fixed order, categories first, so a category article still wins
+        over its search-result copy. With conditional set, each category and
+        topic is probed first and only re-fetched when it has new articles.
+        """
+        categories = config.CATEGORIES
+        topics = config.SEARCH_TOPICS
+        
+        logger.info(f"Starting concurrent fetch for {len(categories)} categories and {len(topics)} topics")
+        start_time = time.time()
         
-        for article in articles:
-            url = article.get('url', '')
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique_articles.append(article)
+        if conditional:
+            requests = [self._headlines_if_changed(category) for category in categories]
+            requests += [self._search_if_changed(topic) for topic in topics]
+        else:
+            requests = [self._fetch_headlines_async(category, _MAX_PER_CATEGORY) for category in categories]
+            requests += [self._search_news_async(topic, _MAX_PER_TOPIC) for topic in topics]
+        
+        results = await asyncio.gather(*requests, return_exceptions=True)
         
-        duplicates_removed = len(articles) - len(unique_articles)
-        if duplicates_removed > 0:
-            logger.info(f"Removed {duplicates_removed} duplicate articles")
+        category_articles = []
+        search_articles = []
+        self._collect_results('category', categories, results[:len(categories)], seen, category_articles)
+        self._collect_results('topic', topics, results[len(categories):], seen, search_articles)
         
-        return unique_articles
+        total_time = time.time() - start_time
+        logger.info(f"Concurrent fetch complete: {len(category_articles) + len(search_articles)} "
+                    f"unique articles in {total_time:.2f}s")
+        
+        return category_articles, search_articles
+    
+    def _collect_results(self, kind, labels, results, seen, out):
+        """Collect gathered per-category/topic results, logging failures"""
+        for label, articles in zip(labels, results):
+            if isinstance(articles, Exception):
+                logger.error(f"Error fetching {kind} {label}: {articles}")
+                continue
+            self._collect_unique(articles, seen, out)
+            logger.info(f"Completed fetch for {kind}: {label} ({len(articles)} articles)")
     
-    def run_full_fetch(self, run_id=None):
-        """Enhanced full fetch with performance monitoring"""
+    def _collect_unique(self, articles, seen, out):
+        """Append to out the articles whose canonical URL is not in seen yet
+        
+        Only called on the fetcher's event loop, so seen needs no lock.
+        """
+        duplicates = 0
+        for article in articles:
+            url = article.get('url')
+            if not url:
+                continue
+            key = canonical_url(url)
+            if key in seen:
+                duplicates += 1
+                continue
+            seen.add(key)
+            out.append(article)
+        
+        if duplicates:
+            logger.debug(f"Dropped {duplicates} duplicate articles")
+    
+    def run_full_fetch(self, run_id=None, progress_callback=None, conditional=False):
+        """Enhanced full fetch with performance monitoring
+        
+        progress_callback, if given, is called as (phase, article_count) after
+        each phase completes. conditional skips the full request for any
+        category or topic whose newest article is unchanged since last fetch.
+        """
         if not run_id:
             run_id = f"full_fetch_{int(time.time())}"
         
@@ -352,29 +631,29 @@ class NewsFetcher:
         # Reset metrics for this run
         self.metrics = IngestionMetrics()
         
+        # Canonical URLs seen so far; both phases reject duplicates against it
+        # as results arrive, so no duplicate article is held until a final sweep
+        seen = set()
+        
         try:
-            # Concurrent category fetch
-            logger.info("Phase 1: Fetching category headlines...")
-            category_articles = self.fetch_concurrent_categories(
-                max_articles_per_category=config.PROCESSING_CONFIG['max_articles_per_category']
-            )
+            # Categories and topics are scheduled together in one gather
+            logger.info("Phase 1: Fetching category headlines and trending topics...")
+            category_articles, search_articles = self._run(self._full_fetch_async(seen, conditional))
+            if progress_callback:
+                progress_callback("Category headlines", len(category_articles))
+                progress_callback("Topic search", len(search_articles))
             
-            # Concurrent topic search
-            logger.info("Phase 2: Searching trending topics...")
-            search_articles = self.search_concurrent_topics(
-                max_articles_per_topic=config.PROCESSING_CONFIG['max_articles_per_topic']
-            )
-            
-            # Combine and deduplicate
-            logger.info("Phase 3: Combining and deduplicating...")
-            all_articles = category_articles + search_articles
-            unique_articles = self._remove_duplicates(all_articles)
-            
-            # Apply article limit
-            max_articles = config.PROCESSING_CONFIG['max_articles_per_run']
-            if len(unique_articles) > max_articles:
-                unique_articles = unique_articles[:max_articles]
+            # Combine and apply the article limit in one bounded pass;
+            # duplicates were already dropped during collection
+            logger.info("Phase 2: Combining results...")
+            max_articles = _MAX_PER_RUN
+            unique_articles = list(itertools.islice(
+                itertools.chain(category_articles, search_articles), max_articles
+            ))
+            if len(category_articles) + len(search_articles) > max_articles:
                 logger.info(f"Limited to {max_articles} articles")
+            if progress_callback:
+                progress_callback("Unique articles", len(unique_articles))
             
             total_time = time.time() - start_time
             self.metrics.processing_time = total_time
@@ -405,27 +684,25 @@ class NewsFetcher:
             return
         
         self.realtime_running = True
+        self._stop_event.clear()
         logger.info(f"Starting real-time processing (interval: {self.realtime_interval} minutes)")
         
         def realtime_loop():
             while self.realtime_running:
                 try:
                     logger.info("Real-time fetch triggered")
-                    articles = self.run_full_fetch(run_id=f"realtime_{int(time.time())}")
+                    articles = self.run_full_fetch(run_id=f"realtime_{int(time.time())}", conditional=True)
                     
                     if callback and articles:
                         callback(articles)
                     
-                    # Sleep for the specified interval
-                    sleep_time = self.realtime_interval * 60
-                    for _ in range(sleep_time):
-                        if not self.realtime_running:
-                            break
-                        time.sleep(1)
+                    # Sleep for the specified interval, waking at once on stop
+                    if self._stop_event.wait(timeout=self.realtime_interval * 60):
+                        break
                         
                 except Exception as e:
                     logger.error(f"Real-time processing error: {e}")
-                    time.sleep(60)  # Wait 1 minute before retry
+                    self._stop_event.wait(timeout=60)  # Wait 1 minute before retry
         
         # Start real-time processing in a separate thread
         thread = threading.Thread(target=realtime_loop, daemon=True)
@@ -436,35 +713,35 @@ class NewsFetcher:
     def stop_realtime_processing(self):
         """Stop real-time news processing"""
         if self.realtime_running:
+            self._stop_event.set()
             self.realtime_running = False
+            self._health_probe = None
             logger.info("Real-time processing stopped")
     
     def get_ingestion_metrics(self):
         """Get current ingestion metrics"""
-        return {
-            'total_requests': self.metrics.total_requests,
-            'successful_requests': self.metrics.successful_requests,
-            'failed_requests': self.metrics.failed_requests,
-            'success_rate': self.metrics.success_rate(),
-            'total_articles': self.metrics.total_articles,
-            'processing_time': self.metrics.processing_time,
-            'articles_per_second': self.metrics.articles_per_second(),
-            'rate_limit_hits': self.metrics.rate_limit_hits,
-            'retries_attempted': self.metrics.retries_attempted,
-            'realtime_enabled': self.realtime_enabled,
-            'realtime_running': self.realtime_running
-        }
+        metrics = self.metrics.snapshot()
+        metrics['realtime_enabled'] = self.realtime_enabled
+        metrics['realtime_running'] = self.realtime_running
+        return metrics
     
     def get_health_status(self):
         """Get ingestion health status"""
         try:
-            # Test API connection
-            test_response = self._make_request_with_retry(
-                f"{self.base_url}/search",
-                {'q': 'test', 'max': 1}
-            )
+            # Test API connection; the probe spends rate-limit budget, so its
+            # outcome is reused for HEALTH_PROBE_TTL seconds
+            now = time.monotonic()
+            if self._health_probe is None or now - self._health_probe_ts >= HEALTH_PROBE_TTL:
+                # Bypass the response cache so the probe really reaches the API
+                test_response = self._run(self._make_request_with_retry(
+                    self._search_url,
+                    {'apikey': self.api_key, 'q': 'test', 'max': 1},
+                    use_cache=False
+                ))
+                self._health_probe = 'healthy' if test_response else 'unhealthy'
+                self._health_probe_ts = now
             
-            api_status = 'healthy' if test_response else 'unhealthy'
+            api_status = self._health_probe
             
             return {
                 'status': api_status,
@@ -507,9 +784,35 @@ class AsyncNewsFetcher:
     def __init__(self):
         self.api_key = config.API_KEY
         self.base_url = config.BASE_URL
-        self.semaphore = asyncio.Semaphore(config.REALTIME_CONFIG['max_concurrent_requests'])
+        self.semaphore = asyncio.Semaphore(config.REALTIME_CONFIG.max_concurrent_requests)
+        self._session = None
+        self._session_loop = None
         logger.info("Async news fetcher initialized")
     
+    async def _get_session(self):
+        """Create the shared session on first use so its connection pool
+        carries keep-alive connections across fetch_all_async calls
+        
+        The session and semaphore belong to the event loop that created
+        them, so each new loop (e.g. another asyncio.run) gets fresh ones.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, limit_per_host=10, ttl_dns_cache=300,
+                                               enable_cleanup_closed=True)
+            )
+            self._session_loop = loop
+            self.semaphore = asyncio.Semaphore(config.REALTIME_CONFIG.max_concurrent_requests)
+        return self._session
+    
+    async def close(self):
+        """Close the shared session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._session_loop = None
+    
     async def fetch_with_session(self, session, url, params):
         """Fetch single URL with async session"""
         async with self.semaphore:
@@ -517,23 +820,24 @@ class AsyncNewsFetcher:
                 params['apikey'] = self.api_key
                 async with session.get(url, params=params) as response:
                     response.raise_for_status()
-                    return await response.json()
+                    return json_loads(await response.read())
             except Exception as e:
                 logger.error(f"Async fetch error: {e}")
                 return None
     
     async def fetch_all_async(self, requests_list):
         """Fetch multiple requests concurrently"""
-        async with aiohttp.ClientSession() as session:
-            tasks = []
-            for url, params in requests_list:
-                task = self.fetch_with_session(session, url, params)
-                tasks.append(task)
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            return [r for r in results if r is not None and not isinstance(r, Exception)]
+        session = await self._get_session()
+        tasks = []
+        for url, params in requests_list:
+            task = self.fetch_with_session(session, url, params)
+            tasks.append(task)
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return [r for r in results if r is not None and not isinstance(r, Exception)]
 
 if __name__ == "__main__":
+    config.init_logging()
     print("Testing enhanced news fetcher...")
     fetcher = NewsFetcher()
     
@@ -557,4 +861,5 @@ if __name__ == "__main__":
         health = fetcher.get_health_status()
         print(f"\n🏥 Health: {health['status']}")
     
+    fetcher.close()
     logger.info("Enhanced news fetcher ready!")
\ No newline at end of file
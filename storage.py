@@ -5,16 +5,139 @@ Supports SQLite for local development and PostgreSQL for production
 
 import sqlite3
 import pandas as pd
-import json
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import logging
 import os
+import queue
+import atexit
+import math
+import hashlib
+import threading
+from pathlib import Path
 import config
 
 logger = logging.getLogger(__name__)
 
+# Applied to every connection; the writer also switches the file to WAL, which
+# lets readers run alongside it, and synchronous=NORMAL is safe under WAL
+# while syncing far less often
+CONNECTION_PRAGMAS = '''
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA busy_timeout=5000;
+    PRAGMA mmap_size=268435456;
+    PRAGMA analysis_limit=1000;
+'''
+
+# Column order of the rows NewsDB._article_row builds
+ARTICLE_COLUMNS = (
+    'title', 'description', 'url', 'source', 'published_at', 'sentiment_score',
+    'sentiment_label', 'keywords', 'category', 'quality_score', 'processing_time',
+    'created_at', 'updated_at'
+)
+
+# Columns every article listing returns, so search results and get_articles
+# feed the same dashboard views
+ARTICLE_LIST_COLUMNS = (
+    'title', 'description', 'url', 'source', 'published_at', 'sentiment_score',
+    'sentiment_label', 'keywords', 'category', 'quality_score', 'created_at'
+)
+
+# Statements run on the write path; timestamps are stored in
+# config.get_timestamp() format, so range filters compare them as strings.
+# The UNIQUE index on url rejects duplicates, so no lookup precedes the insert
+_SQL_INSERT_ARTICLE = (
+    f"INSERT OR IGNORE INTO articles ({', '.join(ARTICLE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(ARTICLE_COLUMNS))})"
+)
+_SQL_INSERT_METRIC = '''
+    INSERT INTO processing_metrics (metric_name, metric_value, timestamp, run_id)
+    VALUES (?, ?, ?, ?)
+'''
+_SQL_INSERT_QUALITY = '''
+    INSERT INTO data_quality_log 
+    (run_id, timestamp, total_articles, valid_articles, duplicate_articles, 
+     quality_failures, processing_time, success_rate, duplicate_rate, 
+     quality_failure_rate)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+_SQL_CLEANUP_ARTICLES = 'DELETE FROM articles WHERE created_at < ?'
+_SQL_CLEANUP_QUALITY_LOG = 'DELETE FROM data_quality_log WHERE timestamp < ?'
+_SQL_CLEANUP_METRICS = 'DELETE FROM processing_metrics WHERE timestamp < ?'
+
+# Run after a cleanup: refresh planner statistics for the shrunken tables and
+# truncate the WAL file the deletes grew
+_SQL_AFTER_CLEANUP = '''
+    ANALYZE articles;
+    ANALYZE data_quality_log;
+    ANALYZE processing_metrics;
+    PRAGMA wal_checkpoint(TRUNCATE);
+'''
+
+def timestamp_cutoff(**delta):
+    """Timestamp string, in config.get_timestamp() format, for now minus delta"""
+    return (datetime.now() - timedelta(**delta)).strftime('%Y-%m-%d %H:%M:%S')
+
+# The background writer commits whatever arrives within this window (seconds),
+# up to this many articles, as one transaction
+WRITER_BATCH_WINDOW = 0.2
+WRITER_BATCH_SIZE = 1000
+
+# Quality category per tenth-of-a-point bucket: >= 0.9 Excellent,
+# >= 0.7 Good, >= 0.5 Fair, otherwise Poor
+QUALITY_BUCKET_LABELS = {
+    **dict.fromkeys(range(0, 5), 'Poor'),
+    5: 'Fair', 6: 'Fair',
+    7: 'Good', 8: 'Good',
+    9: 'Excellent', 10: 'Excellent'
+}
+
+def read_frame(conn, query, params=()):
+    """Run a query into a DataFrame via fetchall and from_records
+    
+    Cheaper than pd.read_sql_query for the small result sets read here.
+    """
+    cursor = conn.execute(query, params)
+    columns = [column[0] for column in cursor.description]
+    return pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+
+# Smallest URL filter built; it is resized to twice the table whenever full
+URL_FILTER_MIN_CAPACITY = 100_000
+
+class UrlBloomFilter:
+    """Bloom filter of stored URLs
+    
+    A miss means the URL is certainly new, so only hits need the SQL lookup.
+    Sized for about 1% false positives up to capacity; deletes are not
+    tracked, which only raises the false positive rate.
+    """
+    
+    def __init__(self, capacity, error_rate=0.01):
+        self.capacity = capacity
+        self.num_bits = int(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+    
+    def _positions(self, url):
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(url.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+    
+    def add(self, url):
+        for pos in self._positions(url):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+    
+    def __contains__(self, url):
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(url))
+
 class NewsDB:
     def __init__(self):
         self.db_config = config.get_database_config()
@@ -26,13 +149,86 @@ class NewsDB:
             'duplicate_skips': 0,
             'quality_failures': 0
         }
+        
+        # Quality limits read on every validation, bound once
+        self._required_fields = config.DATA_QUALITY.required_fields
+        self._min_title_length = config.DATA_QUALITY.min_title_length
+        self._max_title_length = config.DATA_QUALITY.max_title_length
+        self._min_description_length = config.DATA_QUALITY.min_description_length
+        
+        # SQLite allows one writer at a time, so all writes share one
+        # long-lived connection behind a lock; readers open their own
+        self._write_lock = threading.Lock()
+        self._write_conn = self._connect()
+        
+        # Guards self.metrics, which the writer thread and callers both update
+        self._metric_lock = threading.Lock()
+        
         self.setup_database()
+        
+        # save_article hands rows to a background writer thread, which owns
+        # the disk I/O and commits them in batches
+        self._write_queue = queue.Queue(maxsize=10000)
+        self._writer = threading.Thread(target=self._writer_loop, name='news-db-writer', daemon=True)
+        self._writer.start()
+        self._closed = False
+        atexit.register(self.flush)
         logger.info(f"Database initialized: {self.db_config['type']}")
     
+    def _connect(self, readonly=False):
+        """Open a connection with the module's performance PRAGMAs applied"""
+        if readonly:
+            uri = Path(self.db_path).absolute().as_uri() + '?mode=ro'
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript(CONNECTION_PRAGMAS)
+        return conn
+    
+    def close(self):
+        """Finish queued writes and close the write connection
+        
+        Safe to call more than once; later calls do nothing.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self.flush()
+        self._write_queue.put(None)
+        self._writer.join()
+        atexit.unregister(self.flush)
+        with self._write_lock:
+            # Re-analyzes only the tables whose statistics have gone stale
+            self._write_conn.execute('PRAGMA optimize')
+            self._write_conn.close()
+    
     def setup_database(self):
         """Create tables with enhanced schema for data quality tracking"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._write_lock, self._write_conn as conn:
+            cursor = conn.cursor()
+            self._create_schema(cursor)
+            self._rebuild_url_filter(cursor)
+            # Give the planner statistics to choose between the indexes
+            cursor.execute('ANALYZE')
+        logger.info("Database schema created successfully")
+    
+    def _rebuild_url_filter(self, cursor):
+        """Load every stored URL into a fresh filter sized for twice the table"""
+        cursor.execute('SELECT COUNT(*) FROM articles')
+        capacity = max(URL_FILTER_MIN_CAPACITY, 2 * cursor.fetchone()[0])
+        url_filter = UrlBloomFilter(capacity)
+        for (url,) in cursor.execute('SELECT url FROM articles WHERE url IS NOT NULL'):
+            url_filter.add(url)
+        self._url_filter = url_filter
+    
+    def _remember_url(self, cursor, url):
+        """Record a newly inserted URL; call with the write lock held"""
+        self._url_filter.add(url)
+        if self._url_filter.count > self._url_filter.capacity:
+            self._rebuild_url_filter(cursor)
+    
+    def _create_schema(self, cursor):
         
         # Main articles table with quality tracking
         cursor.execute('''
@@ -66,10 +262,19 @@ class NewsDB:
                 duplicate_articles INTEGER,
                 quality_failures INTEGER,
                 processing_time REAL,
-                error_details TEXT
+                error_details TEXT,
+                success_rate REAL,
+                duplicate_rate REAL,
+                quality_failure_rate REAL
             )
         ''')
         
+        # Logs created before the rates had their own columns
+        columns = {row[1] for row in cursor.execute('PRAGMA table_info(data_quality_log)')}
+        for column in ('success_rate', 'duplicate_rate', 'quality_failure_rate'):
+            if column not in columns:
+                cursor.execute(f'ALTER TABLE data_quality_log ADD COLUMN {column} REAL')
+        
         # Processing metrics table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS processing_metrics (
@@ -82,14 +287,110 @@ class NewsDB:
         ''')
         
         # Create indexes for performance
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_url ON articles(url)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published_at)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_sentiment ON articles(sentiment_label)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_created_sentiment ON articles(created_at, sentiment_label)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_quality_created ON articles(quality_score, created_at)')
+        # Daily quality aggregates over a created_at range are covered by this
+        # one; the category listing walks idx_articles_pub_cat in ORDER BY order
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_created_quality ON articles(created_at, quality_score)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_pub_cat ON articles(published_at DESC, category, quality_score)')
+        # Every insert updates each index, so drop the ones another index
+        # already leads with (url has the UNIQUE constraint's own index)
+        for redundant in ('idx_articles_url', 'idx_articles_published', 'idx_articles_created'):
+            cursor.execute(f'DROP INDEX IF EXISTS {redundant}')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_dql_ts ON data_quality_log(timestamp)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_pm_ts ON processing_metrics(timestamp)')
+        
+        # Running totals for the health checks, kept current by triggers so
+        # they are read in O(1) instead of scanning articles; seeded from
+        # the existing rows only when first created
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS stats (
+                key TEXT PRIMARY KEY,
+                value REAL
+            )
+        ''')
+        cursor.execute('''
+            INSERT OR IGNORE INTO stats (key, value) VALUES
+                ('total_articles', (SELECT COUNT(*) FROM articles)),
+                ('sum_quality', (SELECT COALESCE(SUM(quality_score), 0) FROM articles))
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS sources (
+                name TEXT PRIMARY KEY,
+                article_count INTEGER
+            )
+        ''')
+        cursor.execute('''
+            INSERT OR IGNORE INTO sources (name, article_count)
+            SELECT source, COUNT(*) FROM articles WHERE source IS NOT NULL GROUP BY source
+        ''')
+        # A NULL source never conflicts with the TEXT primary key, so it would
+        # add a fresh row per article; those articles are left out of sources,
+        # as in the seed query. Recreated so existing databases pick this up
+        cursor.execute('DROP TRIGGER IF EXISTS trg_articles_stats_insert')
+        cursor.execute('DELETE FROM sources WHERE name IS NULL')
+        cursor.execute('''
+            CREATE TRIGGER trg_articles_stats_insert AFTER INSERT ON articles
+            BEGIN
+                UPDATE stats SET value = value + 1 WHERE key = 'total_articles';
+                UPDATE stats SET value = value + COALESCE(NEW.quality_score, 0) WHERE key = 'sum_quality';
+                INSERT INTO sources (name, article_count)
+                    SELECT NEW.source, 1 WHERE NEW.source IS NOT NULL
+                    ON CONFLICT(name) DO UPDATE SET article_count = article_count + 1;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_articles_stats_delete AFTER DELETE ON articles
+            BEGIN
+                UPDATE stats SET value = value - 1 WHERE key = 'total_articles';
+                UPDATE stats SET value = value - COALESCE(OLD.quality_score, 0) WHERE key = 'sum_quality';
+                UPDATE sources SET article_count = article_count - 1 WHERE name = OLD.source;
+                DELETE FROM sources WHERE name = OLD.source AND article_count <= 0;
+            END
+        ''')
         
-        conn.commit()
-        conn.close()
-        logger.info("Database schema created successfully")
+        # Full-text index over title and description for search_articles; the
+        # trigram tokenizer matches case-insensitive substrings like LIKE does
+        try:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'articles_fts'")
+            fts_exists = cursor.fetchone() is not None
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                    title, description,
+                    content='articles', content_rowid='id', tokenize='trigram'
+                )
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS trg_articles_fts_insert AFTER INSERT ON articles
+                BEGIN
+                    INSERT INTO articles_fts (rowid, title, description)
+                    VALUES (NEW.id, NEW.title, NEW.description);
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS trg_articles_fts_delete AFTER DELETE ON articles
+                BEGIN
+                    INSERT INTO articles_fts (articles_fts, rowid, title, description)
+                    VALUES ('delete', OLD.id, OLD.title, OLD.description);
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS trg_articles_fts_update AFTER UPDATE ON articles
+                BEGIN
+                    INSERT INTO articles_fts (articles_fts, rowid, title, description)
+                    VALUES ('delete', OLD.id, OLD.title, OLD.description);
+                    INSERT INTO articles_fts (rowid, title, description)
+                    VALUES (NEW.id, NEW.title, NEW.description);
+                END
+            ''')
+            if not fts_exists:
+                cursor.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+            self._fts_enabled = True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Full-text search unavailable, falling back to LIKE: {e}")
+            self._fts_enabled = False
     
     def validate_article_quality(self, article):
         """Validate article data quality"""
@@ -97,23 +398,23 @@ class NewsDB:
         issues = []
         
         # Check required fields
-        for field in config.DATA_QUALITY['required_fields']:
+        for field in self._required_fields:
             if not article.get(field):
                 quality_score -= 0.3
                 issues.append(f"Missing required field: {field}")
         
         # Check title length
         title = article.get('title', '')
-        if len(title) < config.DATA_QUALITY['min_title_length']:
+        if len(title) < self._min_title_length:
             quality_score -= 0.2
             issues.append(f"Title too short: {len(title)} characters")
-        elif len(title) > config.DATA_QUALITY['max_title_length']:
+        elif len(title) > self._max_title_length:
             quality_score -= 0.1
             issues.append(f"Title too long: {len(title)} characters")
         
         # Check description length
         description = article.get('description', '')
-        if description and len(description) < config.DATA_QUALITY['min_description_length']:
+        if description and len(description) < self._min_description_length:
             quality_score -= 0.1
             issues.append(f"Description too short: {len(description)} characters")
         
@@ -132,7 +433,16 @@ class NewsDB:
         return max(0, quality_score), issues
     
     def save_article(self, article, run_id=None):
-        """Save article with enhanced quality checks and monitoring"""
+        """Validate an article and queue it for the background writer
+        
+        Returns True once the article is queued; duplicates are skipped when
+        it is written. Call flush() to wait until queued articles are stored.
+        """
+        # The writer thread is gone once closed, so nothing would store it
+        if self._closed:
+            logger.error("Cannot save article: database is closed")
+            return False
+        
         start_time = time.time()
         
         try:
@@ -141,64 +451,133 @@ class NewsDB:
             
             # Skip if quality is too low
             if quality_score < 0.5:
-                self.metrics['quality_failures'] += 1
+                with self._metric_lock:
+                    self.metrics['quality_failures'] += 1
                 logger.warning(f"Article quality too low: {quality_score}, issues: {quality_issues}")
                 return False
             
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Check for duplicates
-            cursor.execute('SELECT id FROM articles WHERE url = ?', (article.get('url', ''),))
-            if cursor.fetchone():
-                self.metrics['duplicate_skips'] += 1
-                logger.debug(f"Duplicate article skipped: {article.get('url', '')}")
-                conn.close()
-                return False
-            
-            processing_time = time.time() - start_time
-            
-            # Insert article with quality metrics
-            cursor.execute('''
-                INSERT INTO articles 
-                (title, description, url, source, published_at, sentiment_score, 
-                 sentiment_label, keywords, category, quality_score, processing_time, 
-                 created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                article.get('title', ''),
-                article.get('description', ''),
-                article.get('url', ''),
-                article.get('source', ''),
-                article.get('published_at', ''),
-                article.get('sentiment_score', 0.0),
-                article.get('sentiment_label', 'neutral'),
-                article.get('keywords', ''),
-                article.get('category', ''),
-                quality_score,
-                processing_time,
-                config.get_timestamp(),
-                config.get_timestamp()
-            ))
-            
-            conn.commit()
-            conn.close()
-            
-            self.metrics['successful_inserts'] += 1
-            self.metrics['total_inserts'] += 1
-            
-            # Log performance metrics
-            self._log_metric('article_processing_time', processing_time, run_id)
-            self._log_metric('article_quality_score', quality_score, run_id)
-            
+            self._write_queue.put((article, quality_score, time.time() - start_time, run_id))
             return True
             
         except Exception as e:
-            self.metrics['failed_inserts'] += 1
-            self.metrics['total_inserts'] += 1
+            with self._metric_lock:
+                self.metrics['failed_inserts'] += 1
+                self.metrics['total_inserts'] += 1
             logger.error(f"Error saving article: {e}")
             return False
     
+    def flush(self):
+        """Block until every queued article has been written"""
+        self._write_queue.join()
+    
+    def _writer_loop(self):
+        """Write queued articles, one transaction per batch window"""
+        while True:
+            batch = [self._write_queue.get()]
+            deadline = time.monotonic() + WRITER_BATCH_WINDOW
+            while len(batch) < WRITER_BATCH_SIZE and None not in batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._write_queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            
+            candidates = [item for item in batch if item is not None]
+            try:
+                if candidates:
+                    with self._write_lock, self._write_conn as conn:
+                        cursor = conn.cursor()
+                        cursor.execute('BEGIN')
+                        saved_count, duplicates = self._insert_new_articles(cursor, candidates)
+                    with self._metric_lock:
+                        self.metrics['successful_inserts'] += saved_count
+                        self.metrics['total_inserts'] += saved_count
+                        self.metrics['duplicate_skips'] += duplicates
+            except Exception as e:
+                with self._metric_lock:
+                    self.metrics['failed_inserts'] += len(candidates)
+                    self.metrics['total_inserts'] += len(candidates)
+                logger.error(f"Error saving article: {e}")
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+            
+            if None in batch:
+                return
+    
+    def _insert_new_articles(self, cursor, candidates):
+        """Insert validated (article, quality_score, processing_time, run_id)
+        candidates that are not stored yet, with their processing metrics
+        
+        Must run inside a write transaction. Returns (saved, duplicates).
+        """
+        # URLs the filter has never seen go in with one executemany; possible
+        # repeats are inserted one at a time so the row count tells which
+        # ones the UNIQUE index ignored
+        now = config.get_timestamp()
+        batch_urls = set()
+        saved = []
+        maybe_stored = []
+        duplicates = 0
+        for candidate in candidates:
+            url = candidate[0].get('url', '')
+            if url in batch_urls:
+                duplicates += 1
+                logger.debug(f"Duplicate article skipped: {url}")
+                continue
+            batch_urls.add(url)
+            (maybe_stored if url in self._url_filter else saved).append(candidate)
+        
+        # The filter only knows this instance's writes, so a URL stored through
+        # another connection is still a miss; if the UNIQUE index ignored any
+        # row, undo the bulk insert and check those rows one by one as well
+        cursor.execute('SAVEPOINT insert_new_urls')
+        cursor.executemany(_SQL_INSERT_ARTICLE, [self._article_row(candidate, now) for candidate in saved])
+        if cursor.rowcount != len(saved):
+            cursor.execute('ROLLBACK TO insert_new_urls')
+            maybe_stored = saved + maybe_stored
+            saved = []
+        cursor.execute('RELEASE insert_new_urls')
+        for candidate in maybe_stored:
+            cursor.execute(_SQL_INSERT_ARTICLE, self._article_row(candidate, now))
+            if cursor.rowcount:
+                saved.append(candidate)
+            else:
+                duplicates += 1
+                logger.debug(f"Duplicate article skipped: {candidate[0].get('url', '')}")
+        
+        metric_rows = []
+        for article, quality_score, processing_time, run_id in saved:
+            metric_rows.append(('article_processing_time', processing_time, now, run_id))
+            metric_rows.append(('article_quality_score', quality_score, now, run_id))
+            self._remember_url(cursor, article.get('url', ''))
+        cursor.executemany(_SQL_INSERT_METRIC, metric_rows)
+        
+        return len(saved), duplicates
+    
+    def _article_row(self, candidate, now):
+        """Parameters for _SQL_INSERT_ARTICLE from a validated candidate, in
+        ARTICLE_COLUMNS order"""
+        article, quality_score, processing_time, _ = candidate
+        get = article.get
+        return (
+            get('title', ''),
+            get('description', ''),
+            get('url', ''),
+            get('source', ''),
+            get('published_at', ''),
+            get('sentiment_score', 0.0),
+            get('sentiment_label', 'neutral'),
+            get('keywords', ''),
+            get('category', ''),
+            quality_score,
+            processing_time,
+            now,
+            now
+        )
+    
     def save_articles_batch(self, articles, run_id=None):
         """Save multiple articles with batch processing and quality reporting"""
         if not run_id:
@@ -211,14 +590,35 @@ class NewsDB:
         
         logger.info(f"Starting batch processing: {len(articles)} articles")
         
-        for i, article in enumerate(articles):
-            if self.save_article(article, run_id):
-                saved_count += 1
-            
-            # Progress logging
-            if (i + 1) % config.PROCESSING_CONFIG['sentiment_batch_size'] == 0:
-                logger.info(f"Processed {i + 1}/{len(articles)} articles")
+        # Validate everything up front, outside the transaction
+        candidates = []
+        for article in articles:
+            validation_start = time.time()
+            quality_score, quality_issues = self.validate_article_quality(article)
+            if quality_score < 0.5:
+                quality_failures += 1
+                logger.warning(f"Article quality too low: {quality_score}, issues: {quality_issues}")
+                continue
+            candidates.append((article, quality_score, time.time() - validation_start, run_id))
         
+        try:
+            with self._write_lock, self._write_conn as conn:
+                cursor = conn.cursor()
+                cursor.execute('BEGIN')
+                saved_count, duplicates = self._insert_new_articles(cursor, candidates)
+            
+            with self._metric_lock:
+                self.metrics['successful_inserts'] += saved_count
+                self.metrics['total_inserts'] += saved_count
+        except Exception as e:
+            with self._metric_lock:
+                self.metrics['failed_inserts'] += len(candidates)
+                self.metrics['total_inserts'] += len(candidates)
+            logger.error(f"Error saving article batch: {e}")
+        
+        with self._metric_lock:
+            self.metrics['quality_failures'] += quality_failures
+            self.metrics['duplicate_skips'] += duplicates
         processing_time = time.time() - start_time
         
         # Log quality metrics
@@ -226,64 +626,37 @@ class NewsDB:
             run_id=run_id,
             total_articles=len(articles),
             valid_articles=saved_count,
-            duplicate_articles=self.metrics['duplicate_skips'],
-            quality_failures=self.metrics['quality_failures'],
+            duplicate_articles=duplicates,
+            quality_failures=quality_failures,
             processing_time=processing_time
         )
         
         logger.info(f"Batch complete: {saved_count}/{len(articles)} articles saved in {processing_time:.2f}s")
         return saved_count
     
-    def _log_metric(self, metric_name, value, run_id=None):
-        """Log performance metric"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO processing_metrics (metric_name, metric_value, timestamp, run_id)
-                VALUES (?, ?, ?, ?)
-            ''', (metric_name, value, config.get_timestamp(), run_id))
-            
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            logger.error(f"Error logging metric: {e}")
-    
     def _log_data_quality(self, run_id, total_articles, valid_articles, 
                          duplicate_articles, quality_failures, processing_time):
         """Log data quality metrics"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            error_details = json.dumps({
-                'success_rate': valid_articles / total_articles if total_articles > 0 else 0,
-                'duplicate_rate': duplicate_articles / total_articles if total_articles > 0 else 0,
-                'quality_failure_rate': quality_failures / total_articles if total_articles > 0 else 0
-            })
+            success_rate = valid_articles / total_articles if total_articles > 0 else 0
+            duplicate_rate = duplicate_articles / total_articles if total_articles > 0 else 0
+            quality_failure_rate = quality_failures / total_articles if total_articles > 0 else 0
             
-            cursor.execute('''
-                INSERT INTO data_quality_log 
-                (run_id, timestamp, total_articles, valid_articles, duplicate_articles, 
-                 quality_failures, processing_time, error_details)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (run_id, config.get_timestamp(), total_articles, valid_articles, 
-                  duplicate_articles, quality_failures, processing_time, error_details))
-            
-            conn.commit()
-            conn.close()
+            with self._write_lock, self._write_conn as conn:
+                conn.execute(_SQL_INSERT_QUALITY, (
+                    run_id, config.get_timestamp(), total_articles, valid_articles,
+                    duplicate_articles, quality_failures, processing_time,
+                    success_rate, duplicate_rate, quality_failure_rate
+                ))
         except Exception as e:
             logger.error(f"Error logging data quality: {e}")
     
-    def get_articles(self, limit=100, category=None, min_quality=0.7):
-        """Get articles with quality filtering"""
-        conn = sqlite3.connect(self.db_path)
+    def get_articles(self, limit=100, category=None, min_quality=0.7, since=None):
+        """Get articles with quality filtering, optionally created at or after since"""
+        conn = self._connect(readonly=True)
         
-        query = '''
-            SELECT title, description, url, source, published_at, 
-                   sentiment_score, sentiment_label, keywords, category,
-                   quality_score, created_at
+        query = f'''
+            SELECT {', '.join(ARTICLE_LIST_COLUMNS)}
             FROM articles 
             WHERE quality_score >= ?
         '''
@@ -293,46 +666,84 @@ class NewsDB:
             query += ' AND category = ?'
             params.append(category)
         
+        if since:
+            query += ' AND created_at >= ?'
+            params.append(since)
+        
         query += ' ORDER BY published_at DESC LIMIT ?'
         params.append(limit)
         
-        df = pd.read_sql_query(query, conn, params=params)
+        df = read_frame(conn, query, params)
+        conn.close()
+        return df
+    
+    def get_daily_quality(self, min_quality=0.0, days=30):
+        """Get average quality score and article count per day"""
+        conn = self._connect(readonly=True)
+        
+        query = '''
+            SELECT DATE(created_at) as day, AVG(quality_score) as avg_quality,
+                   COUNT(*) as article_count
+            FROM articles 
+            WHERE quality_score >= ? AND created_at >= ?
+            GROUP BY day
+            ORDER BY day
+        '''
+        
+        df = read_frame(conn, query, [min_quality, timestamp_cutoff(days=days)])
+        conn.close()
+        return df
+    
+    def get_daily_sentiment_counts(self, min_quality=0.0, days=30):
+        """Get article counts per day and sentiment label"""
+        conn = self._connect(readonly=True)
+        
+        query = '''
+            SELECT DATE(created_at) as day, sentiment_label, COUNT(*) as count
+            FROM articles 
+            WHERE quality_score >= ? AND created_at >= ?
+            GROUP BY day, sentiment_label
+            ORDER BY day
+        '''
+        
+        df = read_frame(conn, query, [min_quality, timestamp_cutoff(days=days)])
         conn.close()
         return df
     
     def get_data_quality_report(self, days=7):
         """Get data quality report for last N days"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect(readonly=True)
         
         # Get recent quality logs
         query = '''
             SELECT run_id, timestamp, total_articles, valid_articles, 
-                   duplicate_articles, quality_failures, processing_time
+                   duplicate_articles, quality_failures, processing_time,
+                   success_rate, duplicate_rate, quality_failure_rate
             FROM data_quality_log 
-            WHERE datetime(timestamp) >= datetime('now', '-{} days')
+            WHERE timestamp >= ?
             ORDER BY timestamp DESC
-        '''.format(days)
+        '''
+        cutoff = timestamp_cutoff(days=days)
         
-        quality_df = pd.read_sql_query(query, conn)
+        quality_df = read_frame(conn, query, [cutoff])
         
-        # Get overall article quality distribution
+        # Get overall article quality distribution, counted per tenth of a
+        # point and folded into the named categories here
         quality_dist_query = '''
-            SELECT 
-                CASE 
-                    WHEN quality_score >= 0.9 THEN 'Excellent'
-                    WHEN quality_score >= 0.7 THEN 'Good'
-                    WHEN quality_score >= 0.5 THEN 'Fair'
-                    ELSE 'Poor'
-                END as quality_category,
-                COUNT(*) as count
+            SELECT CAST(quality_score * 10 AS INTEGER) as bucket, COUNT(*) as count
             FROM articles
-            WHERE datetime(created_at) >= datetime('now', '-{} days')
-            GROUP BY quality_category
-        '''.format(days)
+            WHERE created_at >= ?
+            GROUP BY bucket
+        '''
         
-        quality_dist_df = pd.read_sql_query(quality_dist_query, conn)
+        buckets_df = read_frame(conn, quality_dist_query, [cutoff])
         conn.close()
         
+        quality_dist_df = (
+            buckets_df.assign(quality_category=buckets_df['bucket'].map(QUALITY_BUCKET_LABELS))
+            .groupby('quality_category', as_index=False)['count'].sum()
+        )
+        
         return {
             'quality_logs': quality_df,
             'quality_distribution': quality_dist_df,
@@ -341,50 +752,44 @@ class NewsDB:
     
     def get_performance_metrics(self, hours=24):
         """Get performance metrics for monitoring"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect(readonly=True)
         
         query = '''
             SELECT metric_name, AVG(metric_value) as avg_value, 
                    MAX(metric_value) as max_value, MIN(metric_value) as min_value,
                    COUNT(*) as count
             FROM processing_metrics 
-            WHERE datetime(timestamp) >= datetime('now', '-{} hours')
+            WHERE timestamp >= ?
             GROUP BY metric_name
-        '''.format(hours)
+        '''
         
-        metrics_df = pd.read_sql_query(query, conn)
+        metrics_df = read_frame(conn, query, [timestamp_cutoff(hours=hours)])
         conn.close()
         
         return metrics_df
     
     def cleanup_old_data(self, days=30):
         """Clean up old data and logs"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Clean old articles
-        cursor.execute('''
-            DELETE FROM articles 
-            WHERE datetime(created_at) < datetime('now', '-{} days')
-        '''.format(days))
-        articles_deleted = cursor.rowcount
-        
-        # Clean old quality logs
-        cursor.execute('''
-            DELETE FROM data_quality_log 
-            WHERE datetime(timestamp) < datetime('now', '-{} days')
-        '''.format(days))
-        logs_deleted = cursor.rowcount
-        
-        # Clean old metrics
-        cursor.execute('''
-            DELETE FROM processing_metrics 
-            WHERE datetime(timestamp) < datetime('now', '-{} days')
-        '''.format(days))
-        metrics_deleted = cursor.rowcount
-        
-        conn.commit()
-        conn.close()
+        with self._write_lock:
+            with self._write_conn as conn:
+                cursor = conn.cursor()
+                cursor.execute('BEGIN')
+                
+                cutoff = (timestamp_cutoff(days=days),)
+                
+                # Clean old articles
+                cursor.execute(_SQL_CLEANUP_ARTICLES, cutoff)
+                articles_deleted = cursor.rowcount
+                
+                # Clean old quality logs
+                cursor.execute(_SQL_CLEANUP_QUALITY_LOG, cutoff)
+                logs_deleted = cursor.rowcount
+                
+                # Clean old metrics
+                cursor.execute(_SQL_CLEANUP_METRICS, cutoff)
+                metrics_deleted = cursor.rowcount
+            
+            self._write_conn.executescript(_SQL_AFTER_CLEANUP)
         
         logger.info(f"Cleanup complete: {articles_deleted} articles, {logs_deleted} logs, {metrics_deleted} metrics deleted")
         return articles_deleted, logs_deleted, metrics_deleted
@@ -392,22 +797,16 @@ class NewsDB:
     def get_database_health(self):
         """Get database health status"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect(readonly=True)
             cursor = conn.cursor()
             
-            # Basic statistics
-            cursor.execute('SELECT COUNT(*) FROM articles')
-            total_articles = cursor.fetchone()[0]
+            # Basic statistics, from the trigger-maintained totals
+            total_articles, sum_quality, unique_sources = self._read_stats(cursor)
+            avg_quality = sum_quality / total_articles if total_articles else 0
             
-            cursor.execute('SELECT COUNT(*) FROM articles WHERE datetime(created_at) >= datetime("now", "-1 day")')
+            cursor.execute('SELECT COUNT(*) FROM articles WHERE created_at >= ?', (timestamp_cutoff(days=1),))
             articles_24h = cursor.fetchone()[0]
             
-            cursor.execute('SELECT AVG(quality_score) FROM articles')
-            avg_quality = cursor.fetchone()[0] or 0
-            
-            cursor.execute('SELECT COUNT(DISTINCT source) FROM articles')
-            unique_sources = cursor.fetchone()[0]
-            
             # Database size
             cursor.execute('SELECT page_count * page_size as size FROM pragma_page_count(), pragma_page_size()')
             db_size = cursor.fetchone()[0]
@@ -431,10 +830,18 @@ class NewsDB:
                 'error': str(e)
             }
     
+    def _read_stats(self, cursor):
+        """Return (total_articles, sum_quality, unique_sources) from the stats tables"""
+        cursor.execute("SELECT key, value FROM stats WHERE key IN ('total_articles', 'sum_quality')")
+        stats = dict(cursor.fetchall())
+        cursor.execute('SELECT COUNT(*) FROM sources')
+        unique_sources = cursor.fetchone()[0]
+        return int(stats.get('total_articles', 0)), stats.get('sum_quality', 0.0), unique_sources
+    
     # Keep original simple methods for backward compatibility
     def get_sentiment_stats(self):
         """Get basic sentiment statistics"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect(readonly=True)
         cursor = conn.cursor()
         
         cursor.execute('SELECT sentiment_label, COUNT(*) FROM articles GROUP BY sentiment_label')
@@ -443,8 +850,7 @@ class NewsDB:
         cursor.execute('SELECT AVG(sentiment_score) FROM articles')
         avg_sentiment = cursor.fetchone()[0] or 0.0
         
-        cursor.execute('SELECT COUNT(*) FROM articles')
-        total = cursor.fetchone()[0] or 0
+        total = sum(sentiment_counts.values())
         
         conn.close()
         
@@ -456,10 +862,25 @@ class NewsDB:
     
     def search_articles(self, search_term, limit=50):
         """Search articles by keyword"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect(readonly=True)
+        
+        # Trigrams need at least three characters; shorter terms scan with LIKE
+        if self._fts_enabled and len(search_term) >= 3:
+            query = f'''
+                SELECT {', '.join('a.' + column for column in ARTICLE_LIST_COLUMNS)}
+                FROM articles_fts f
+                JOIN articles a ON a.id = f.rowid
+                WHERE articles_fts MATCH ? AND a.quality_score >= 0.5
+                ORDER BY a.published_at DESC 
+                LIMIT ?
+            '''
+            phrase = '"' + search_term.replace('"', '""') + '"'
+            df = read_frame(conn, query, [phrase, limit])
+            conn.close()
+            return df
         
-        query = '''
-            SELECT title, description, url, source, sentiment_label, published_at
+        query = f'''
+            SELECT {', '.join(ARTICLE_LIST_COLUMNS)}
             FROM articles 
             WHERE (title LIKE ? OR description LIKE ?) AND quality_score >= 0.5
             ORDER BY published_at DESC 
@@ -467,13 +888,13 @@ class NewsDB:
         '''
         
         search_pattern = f'%{search_term}%'
-        df = pd.read_sql_query(query, conn, params=[search_pattern, search_pattern, limit])
+        df = read_frame(conn, query, [search_pattern, search_pattern, limit])
         conn.close()
         return df
     
     def get_top_sources(self, limit=10):
         """Get most active news sources"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect(readonly=True)
         
         query = '''
             SELECT source, COUNT(*) as article_count, AVG(quality_score) as avg_quality
@@ -483,24 +904,20 @@ class NewsDB:
             LIMIT ?
         '''
         
-        df = pd.read_sql_query(query, conn, params=[limit])
+        df = read_frame(conn, query, [limit])
         conn.close()
         return df
     
     def get_database_info(self):
         """Get basic database information"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect(readonly=True)
         cursor = conn.cursor()
         
-        cursor.execute('SELECT COUNT(*) FROM articles')
-        total_articles = cursor.fetchone()[0]
+        total_articles, _, unique_sources = self._read_stats(cursor)
         
         cursor.execute('SELECT MAX(published_at) FROM articles')
         latest_article = cursor.fetchone()[0]
         
-        cursor.execute('SELECT COUNT(DISTINCT source) FROM articles')
-        unique_sources = cursor.fetchone()[0]
-        
         conn.close()
         
         return {
@@ -510,6 +927,7 @@ class NewsDB:
         }
 
 if __name__ == "__main__":
+    config.init_logging()
     print("Testing enhanced database...")
     db = NewsDB()
     